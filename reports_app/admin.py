@@ -3,6 +3,8 @@ Django admin configuration for Academic Achievement Award Summarizer.
 """
 
 from django.contrib import admin
+from django.db import router
+from django.db.models import Func, IntegerField
 from .models import (
     AcademicYear,
     FacultyMember,
@@ -12,6 +14,36 @@ from .models import (
 )
 
 
+class JSONArrayLength(Func):
+    """Length of a JSON array column, computed in the database."""
+
+    function = 'JSON_ARRAY_LENGTH'
+    output_field = IntegerField()
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return super().as_sql(compiler, connection, function='JSONB_ARRAY_LENGTH', **extra_context)
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        return super().as_sql(compiler, connection, function='JSON_LENGTH', **extra_context)
+
+
+class FacultyRelatedAdmin(admin.ModelAdmin):
+    """
+    Loads the faculty FK for changelist rows in bulk.
+
+    A JOIN when FacultyMember lives in the same database; otherwise (the
+    FacultyRouter sends it to faculty_db) one IN query via prefetch_related.
+    """
+
+    list_select_related = ('academic_year',)
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        if router.db_for_read(FacultyMember) == router.db_for_read(self.model):
+            return qs.select_related('faculty')
+        return qs.prefetch_related('faculty')
+
+
 @admin.register(AcademicYear)
 class AcademicYearAdmin(admin.ModelAdmin):
     list_display = ('year_code', 'start_date', 'end_date', 'is_current')
@@ -59,6 +91,7 @@ class SurveyImportAdmin(admin.ModelAdmin):
     )
     list_filter = ('academic_year', 'imported_at')
     ordering = ('-imported_at',)
+    list_select_related = ('academic_year',)
     readonly_fields = (
         'imported_at',
         'filename',
@@ -67,13 +100,20 @@ class SurveyImportAdmin(admin.ModelAdmin):
         'unmatched_emails',
     )
 
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        # Count in the database so the changelist needn't walk every email list
+        return qs.annotate(_unmatched_count=JSONArrayLength('unmatched_emails'))
+
     @admin.display(description='Unmatched')
     def unmatched_count(self, obj):
+        if hasattr(obj, '_unmatched_count'):
+            return obj._unmatched_count or 0
         return len(obj.unmatched_emails) if obj.unmatched_emails else 0
 
 
 @admin.register(FacultySurveyData)
-class FacultySurveyDataAdmin(admin.ModelAdmin):
+class FacultySurveyDataAdmin(FacultyRelatedAdmin):
     list_display = (
         'faculty',
         'academic_year',
@@ -119,7 +159,7 @@ class FacultySurveyDataAdmin(admin.ModelAdmin):
 
 
 @admin.register(DepartmentalData)
-class DepartmentalDataAdmin(admin.ModelAdmin):
+class DepartmentalDataAdmin(FacultyRelatedAdmin):
     list_display = (
         'faculty',
         'academic_year',
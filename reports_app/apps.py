@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class ReportsAppConfig(AppConfig):
     name = 'reports_app'
+
+    def ready(self):
+        from . import signals  # noqa: F401 - registers signal handlers
@@ -4,32 +4,37 @@ Context processors for reports_app.
 These add variables to all template contexts automatically.
 """
 
+from django.utils.functional import SimpleLazyObject
+
 from .models import AcademicYear
 
 
+def _resolve_selected(request):
+    """Selected year from the session, falling back to the marked current year."""
+    selected_year_code = request.session.get('selected_academic_year')
+
+    if selected_year_code:
+        try:
+            return AcademicYear.objects.get(year_code=selected_year_code)
+        except AcademicYear.DoesNotExist:
+            pass
+    return AcademicYear.get_current()
+
+
 def academic_year_context(request):
     """
     Add academic year information to all templates.
 
+    Values are wrapped in SimpleLazyObject so templates that never reference
+    them don't pay for the queries (and each is evaluated at most once).
+
     Provides:
     - academic_years: All academic years (most recent first)
-    - current_academic_year: The currently selected year (from session or default)
+    - selected_academic_year: The currently selected year (from session or default)
     """
-    # Get all years
-    years = AcademicYear.objects.all().order_by('-year_code')
-
-    # Get selected year from session, or use the marked current year
-    selected_year_code = request.session.get('selected_academic_year')
-
-    if selected_year_code:
-        try:
-            selected_year = AcademicYear.objects.get(year_code=selected_year_code)
-        except AcademicYear.DoesNotExist:
-            selected_year = AcademicYear.get_current()
-    else:
-        selected_year = AcademicYear.get_current()
-
     return {
-        'academic_years': years,
-        'selected_academic_year': selected_year,
+        'academic_years': SimpleLazyObject(
+            lambda: list(AcademicYear.objects.all().order_by('-year_code'))
+        ),
+        'selected_academic_year': SimpleLazyObject(lambda: _resolve_selected(request)),
     }
@@ -5,77 +5,279 @@ Uses CrossRef API to get journal info from DOI, then looks up
 impact factor from a journal database.
 """
 
-import requests
-from typing import Dict, Any, Optional, Tuple
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from functools import lru_cache
+from urllib.parse import quote
 
-
-CROSSREF_API = "https://api.crossref.org/works/"
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List, Optional, Tuple
+from django.conf import settings
+
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# orjson parses the raw response bytes several times faster than the stdlib
+try:
+    import orjson
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
+
+CROSSREF_API = "https://api.crossref.org/works"
 OPENALEX_API = "https://api.openalex.org/works/doi:"
 
 # User agent for API requests (be a good API citizen)
 HEADERS = {
-    "User-Agent": "AcademicAchievementSummarizer/1.0 (mailto:admin@example.com)"
+    "User-Agent": (
+        f"AcademicAchievementSummarizer/1.0 (mailto:{settings.CROSSREF_MAILTO})"
+        if settings.CROSSREF_MAILTO else "AcademicAchievementSummarizer/1.0"
+    )
 }
 
+# CrossRef and OpenAlex route requests carrying a mailto parameter to their
+# "polite pool", which is served by dedicated, less loaded machines
+POLITE_PARAMS = {"mailto": settings.CROSSREF_MAILTO} if settings.CROSSREF_MAILTO else {}
 
-def lookup_doi(doi: str) -> Optional[Dict[str, Any]]:
+# Shared session so repeated lookups reuse pooled keep-alive connections
+# instead of paying a TCP + TLS handshake per request. When requests-cache
+# is installed, responses are also persisted to SQLite so re-running the
+# verification doesn't hit CrossRef/OpenAlex again for known DOIs/ISSNs.
+_SESSION = None
+if REQUESTS_CACHE_AVAILABLE:
+    try:
+        settings.DOI_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        print(f"DOI lookup cache disabled: cannot create {settings.DOI_CACHE_PATH.parent}: {e}")
+    else:
+        _SESSION = requests_cache.CachedSession(
+            cache_name=str(settings.DOI_CACHE_PATH),
+            backend='sqlite',
+            expire_after=timedelta(days=settings.DOI_CACHE_EXPIRE_DAYS),
+            allowable_methods=['GET'],
+            cache_control=True,
+        )
+if _SESSION is None:
+    _SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=1.0,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET'],
+        respect_retry_after_header=True,
+    ),
+))
+
+# (connect, read): fail fast on unreachable hosts, but give CrossRef room
+# for the slow reads it serves under load
+REQUEST_TIMEOUT = (3.05, 30)
+
+# Concurrent lookups during bulk verification; the rate limit keeps us
+# inside the CrossRef/OpenAlex polite-pool allowance
+LOOKUP_WORKERS = 8
+MAX_REQUESTS_PER_SECOND = 50
+
+
+class _RateLimiter:
+    """Spaces out calls so no more than `rate` start per second across threads."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self.lock = threading.Lock()
+        self.next_slot = 0.0
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_RATE_LIMITER = _RateLimiter(MAX_REQUESTS_PER_SECOND)
+
+
+def _get(url: str, **kwargs) -> requests.Response:
+    """Rate-limited GET through the shared session, with polite-pool params."""
+    kwargs["params"] = {**POLITE_PARAMS, **(kwargs.get("params") or {})}
+    _RATE_LIMITER.wait()
+    return _SESSION.get(url, **kwargs)
+
+
+# CrossRef accepts up to 1000 rows per query; keep chunks small enough that
+# the filter string stays well under URL length limits.
+CROSSREF_BATCH_SIZE = 50
+
+# Only request the fields _parse_crossref_work reads; full work records
+# (references, funders, licences...) are an order of magnitude larger
+CROSSREF_SELECT = "DOI,title,container-title,ISSN,publisher,published-print,published-online,type"
+
+
+# Resolver URL (doi.org / dx.doi.org, http or https) or "doi:" label, any case
+_DOI_PREFIX = re.compile(r'^(?:https?://(?:dx\.)?doi\.org/|doi:\s*)', re.IGNORECASE)
+_ENCODED_SLASH = re.compile(r'%2F', re.IGNORECASE)
+
+
+def normalize_doi(doi: str) -> str:
     """
-    Look up publication metadata from DOI using CrossRef API.
+    Reduce a DOI string to its bare "10.xxxx/..." form.
 
-    Args:
-        doi: The DOI string (with or without https://doi.org/ prefix)
+    Strips whitespace, any doi.org / doi: prefix and trailing slashes, and
+    decodes %2F so pasted URL-encoded DOIs match (and cache) like plain ones.
+    Encoding for the request itself is left to requests' params handling.
+    """
+    doi = _DOI_PREFIX.sub('', doi.strip())
+    return _ENCODED_SLASH.sub('/', doi).rstrip('/')
 
-    Returns:
-        Dict with publication info or None if not found
+
+def _parse_crossref_work(doi: str, message: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the fields we use from a CrossRef work record."""
+    result = {
+        "doi": doi,
+        "title": message.get("title", [""])[0] if message.get("title") else "",
+        "journal": message.get("container-title", [""])[0] if message.get("container-title") else "",
+        "issn": message.get("ISSN", []),
+        "publisher": message.get("publisher", ""),
+        "published_date": None,
+        "type": message.get("type", ""),
+    }
+
+    # Get publication date
+    if "published-print" in message:
+        date_parts = message["published-print"].get("date-parts", [[]])[0]
+        if date_parts:
+            result["published_date"] = "-".join(str(p) for p in date_parts)
+    elif "published-online" in message:
+        date_parts = message["published-online"].get("date-parts", [[]])[0]
+        if date_parts:
+            result["published_date"] = "-".join(str(p) for p in date_parts)
+
+    return result
+
+
+def _batchable_doi(doi: str) -> bool:
     """
-    # Clean DOI
-    doi = doi.strip()
-    if doi.startswith("https://doi.org/"):
-        doi = doi[16:]
-    elif doi.startswith("http://doi.org/"):
-        doi = doi[15:]
-    elif doi.startswith("doi:"):
-        doi = doi[4:]
+    Whether a DOI can go in a filter=doi:... query.
 
-    try:
-        response = requests.get(
-            f"{CROSSREF_API}{doi}",
-            headers=HEADERS,
-            timeout=10
-        )
+    DOIs come from free-text survey fields; anything that isn't a "10."
+    DOI, or that contains the filter's comma separator, would break the
+    whole batch query and is looked up on its own instead.
+    """
+    return doi.startswith("10.") and "," not in doi
 
-        if response.status_code == 200:
-            data = response.json()
-            message = data.get("message", {})
-
-            # Extract relevant fields
-            result = {
-                "doi": doi,
-                "title": message.get("title", [""])[0] if message.get("title") else "",
-                "journal": message.get("container-title", [""])[0] if message.get("container-title") else "",
-                "issn": message.get("ISSN", []),
-                "publisher": message.get("publisher", ""),
-                "published_date": None,
-                "type": message.get("type", ""),
-            }
-
-            # Get publication date
-            if "published-print" in message:
-                date_parts = message["published-print"].get("date-parts", [[]])[0]
-                if date_parts:
-                    result["published_date"] = "-".join(str(p) for p in date_parts)
-            elif "published-online" in message:
-                date_parts = message["published-online"].get("date-parts", [[]])[0]
-                if date_parts:
-                    result["published_date"] = "-".join(str(p) for p in date_parts)
-
-            return result
 
+def _lookup_single_doi(doi: str) -> Optional[Dict[str, Any]]:
+    """Look up one DOI via /works/{doi}; None if CrossRef can't resolve it."""
+    try:
+        response = _get(
+            f"{CROSSREF_API}/{quote(doi, safe='/')}",
+            timeout=REQUEST_TIMEOUT
+        )
     except requests.RequestException as e:
         print(f"Error looking up DOI {doi}: {e}")
+        return None
+
+    if response.status_code != 200:
+        return None
+
+    try:
+        data = _json_loads(response.content)
+    except ValueError as e:
+        print(f"Error parsing CrossRef response for DOI {doi}: {e}")
+        return None
 
-    return None
+    return _parse_crossref_work(doi, data.get("message", {}))
+
+
+def _batch_lookup_dois(dois: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Look up many DOIs with as few CrossRef requests as possible.
+
+    Uses the /works?filter=doi:...,doi:... query so each request resolves
+    up to CROSSREF_BATCH_SIZE DOIs. DOIs that can't be batched, that were
+    in a failed batch request, or that a batch didn't return are retried
+    one at a time, so one bad entry can't fail the others.
+
+    Args:
+        dois: Normalized DOI strings (duplicates are ignored)
+
+    Returns:
+        Dict mapping lowercased DOI -> publication info. DOIs that CrossRef
+        doesn't know about are absent.
+    """
+    # DOIs are case-insensitive; dedupe so shared publications cost one lookup
+    unique = list(dict.fromkeys(d.lower() for d in dois if d))
+    batchable = [d for d in unique if _batchable_doi(d)]
+    results = {}
+
+    for start in range(0, len(batchable), CROSSREF_BATCH_SIZE):
+        chunk = batchable[start:start + CROSSREF_BATCH_SIZE]
+        try:
+            response = _get(
+                CROSSREF_API,
+                params={
+                    "filter": ",".join(f"doi:{d}" for d in chunk),
+                    "rows": len(chunk),
+                    "select": CROSSREF_SELECT,
+                },
+                timeout=REQUEST_TIMEOUT
+            )
+        except requests.RequestException as e:
+            print(f"Error looking up {len(chunk)} DOIs: {e}")
+            continue
+
+        if response.status_code != 200:
+            continue
+
+        try:
+            data = _json_loads(response.content)
+        except ValueError as e:
+            print(f"Error parsing CrossRef response for {len(chunk)} DOIs: {e}")
+            continue
+
+        for item in data.get("message", {}).get("items", []):
+            doi = item.get("DOI", "").lower()
+            if doi:
+                results[doi] = _parse_crossref_work(doi, item)
+
+    unresolved = [d for d in unique if d not in results]
+    if unresolved:
+        with ThreadPoolExecutor(max_workers=LOOKUP_WORKERS) as executor:
+            for doi, info in zip(unresolved, executor.map(_lookup_single_doi, unresolved)):
+                if info is not None:
+                    results[doi] = info
+
+    return results
+
+
+def lookup_doi(doi: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up publication metadata from DOI using CrossRef API.
+
+    Args:
+        doi: The DOI string (with or without https://doi.org/ prefix)
+
+    Returns:
+        Dict with publication info or None if not found
+    """
+    return _lookup_single_doi(normalize_doi(doi))
 
 
 def lookup_journal_metrics(issn: str) -> Optional[Dict[str, Any]]:
@@ -85,34 +287,52 @@ def lookup_journal_metrics(issn: str) -> Optional[Dict[str, Any]]:
     Note: OpenAlex provides citation counts and h-index, not traditional IF.
     """
     try:
-        response = requests.get(
-            f"https://api.openalex.org/sources/issn:{issn}",
-            headers=HEADERS,
-            timeout=10
-        )
+        metrics = _fetch_journal_metrics(issn)
+    except (requests.RequestException, ValueError) as e:
+        print(f"Error looking up journal metrics for ISSN {issn}: {e}")
+        return None
+
+    return dict(metrics) if metrics else None
+
+
+@lru_cache(maxsize=4096)
+def _fetch_journal_metrics(issn: str) -> Optional[Dict[str, Any]]:
+    """
+    OpenAlex lookup memoized per ISSN for the life of the process.
+
+    The same journals recur across faculty, and "not found" answers are
+    cached too; network/parse errors raise, so they are retried next time.
+    """
+    response = _get(
+        f"https://api.openalex.org/sources/issn:{issn}",
+        timeout=REQUEST_TIMEOUT
+    )
 
-        if response.status_code == 200:
-            data = response.json()
-            return {
-                "display_name": data.get("display_name", ""),
-                "works_count": data.get("works_count", 0),
-                "cited_by_count": data.get("cited_by_count", 0),
-                "h_index": data.get("summary_stats", {}).get("h_index", 0),
-                "2yr_mean_citedness": data.get("summary_stats", {}).get("2yr_mean_citedness", 0),
-            }
-    except requests.RequestException:
-        pass
+    if response.status_code != 200:
+        return None
 
-    return None
+    data = _json_loads(response.content)
+    return {
+        "display_name": data.get("display_name", ""),
+        "works_count": data.get("works_count", 0),
+        "cited_by_count": data.get("cited_by_count", 0),
+        "h_index": data.get("summary_stats", {}).get("h_index", 0),
+        "2yr_mean_citedness": data.get("summary_stats", {}).get("2yr_mean_citedness", 0),
+    }
 
 
-def verify_publication_if(doi: str, reported_if: float) -> Dict[str, Any]:
+def verify_publication_if(
+    doi: str,
+    reported_if: float,
+    pub_info: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
     """
     Verify a publication's impact factor by looking up the DOI.
 
     Args:
         doi: The publication DOI
         reported_if: The self-reported impact factor
+        pub_info: Pre-fetched CrossRef info (skips the DOI lookup if given)
 
     Returns:
         Dict with verification results
@@ -127,7 +347,8 @@ def verify_publication_if(doi: str, reported_if: float) -> Dict[str, Any]:
     }
 
     # Look up DOI
-    pub_info = lookup_doi(doi)
+    if pub_info is None:
+        pub_info = lookup_doi(doi)
     if not pub_info:
         result["notes"].append("Could not look up DOI via CrossRef")
         return result
@@ -139,7 +360,8 @@ def verify_publication_if(doi: str, reported_if: float) -> Dict[str, Any]:
 
     # Try to get journal metrics from OpenAlex
     if pub_info.get("issn"):
-        for issn in pub_info["issn"]:
+        # Print and online ISSNs are sometimes listed twice
+        for issn in dict.fromkeys(pub_info["issn"]):
             metrics = lookup_journal_metrics(issn)
             if metrics:
                 result["journal_metrics"] = metrics
@@ -157,11 +379,12 @@ def verify_all_publications() -> list:
     Returns:
         List of verification results
     """
-    from .models import FacultySurveyData
+    from .models import FacultyMember, FacultySurveyData
 
-    results = []
+    # Collect publications first so DOIs can be looked up in batches
+    pending = []
 
-    for sd in FacultySurveyData.objects.select_related('faculty').all():
+    for sd in FacultySurveyData.objects.all():
         activities = sd.activities_json or {}
         if 'content_expert' not in activities:
             continue
@@ -184,14 +407,40 @@ def verify_all_publications() -> list:
             except (ValueError, TypeError):
                 reported_if = 0
 
-            verification = verify_publication_if(doi, reported_if)
-            verification["faculty_name"] = sd.faculty.display_name
-            verification["faculty_email"] = sd.faculty.email
-            verification["pub_title_reported"] = pub.get('title', '')[:60]
-            verification["journal_reported"] = pub.get('journal', '')
-            verification["points"] = pub.get('points', 0)
+            pending.append((sd, pub, doi, reported_if))
 
-            results.append(verification)
+    # FacultyMember may live in faculty_db, where select_related can't JOIN;
+    # fetch everyone needed in one IN query instead of one query per row
+    faculty_map = FacultyMember.objects.in_bulk({sd.faculty_id for sd, _, _, _ in pending})
+
+    pub_infos = _batch_lookup_dois([normalize_doi(doi) for _, _, doi, _ in pending])
+
+    # Journal metric lookups are independent network calls - run them
+    # concurrently. Fetch each distinct primary ISSN once up front so
+    # publications in the same journal don't race to look it up.
+    primary_issns = {
+        info["issn"][0] for info in pub_infos.values() if info.get("issn")
+    }
+    with ThreadPoolExecutor(max_workers=LOOKUP_WORKERS) as executor:
+        list(executor.map(lookup_journal_metrics, primary_issns))
+        futures = [
+            # Missing from the batch response means CrossRef doesn't know it
+            executor.submit(verify_publication_if, doi, reported_if,
+                            pub_infos.get(normalize_doi(doi).lower(), {}))
+            for _, _, doi, reported_if in pending
+        ]
+
+    results = []
+    for (sd, pub, doi, reported_if), future in zip(pending, futures):
+        verification = future.result()
+        faculty = faculty_map[sd.faculty_id]
+        verification["faculty_name"] = faculty.display_name
+        verification["faculty_email"] = faculty.email
+        verification["pub_title_reported"] = pub.get('title', '')[:60]
+        verification["journal_reported"] = pub.get('journal', '')
+        verification["points"] = pub.get('points', 0)
+
+        results.append(verification)
 
     return results
 
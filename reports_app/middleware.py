@@ -0,0 +1,22 @@
+"""
+Middleware for reports_app.
+"""
+
+from .points_utils import invalidate_point_config_cache
+
+
+class PointConfigCacheMiddleware:
+    """
+    Scope the memoized point configuration to a single request.
+
+    Signals only reach the worker process that saved the change, so each
+    request starts from a fresh config map; within the request it is
+    queried at most once.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        invalidate_point_config_cache()
+        return self.get_response(request)
@@ -5,19 +5,44 @@ This module provides functions to calculate points using ActivityType
 configurations from the database instead of hardcoded values.
 """
 
-from typing import Dict, Any, Optional, Tuple
+import json
+from collections import defaultdict
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Any, Iterator, Optional, Tuple
 from .models import ActivityType, ActivityGoal, ActivityCategory
 
 
+# Bumped whenever the point configuration changes (see signals.py and
+# PointConfigCacheMiddleware) so the memoized map below is rebuilt
+_config_version = 0
+
+
+def invalidate_point_config_cache():
+    """Discard the cached point configuration; the next lookup re-queries."""
+    global _config_version
+    _config_version += 1
+
+
 def get_point_config_map() -> Dict[str, Dict[str, Any]]:
     """
     Build a mapping of data_variable -> point configuration.
 
+    The map is memoized until the ActivityType configuration changes (or,
+    in the web app, until the next request), so batch callers pay for the
+    query once. Treat the returned dict as read-only.
+
     Returns:
         Dict mapping data_variable to {base_points, modifier_type, max_count, max_points}
     """
+    return _build_point_config_map(_config_version)
+
+
+@lru_cache(maxsize=1)
+def _build_point_config_map(version: int) -> Dict[str, Dict[str, Any]]:
+    """Query active ActivityTypes; cached per configuration version."""
     config_map = {}
-    for activity_type in ActivityType.objects.filter(is_active=True):
+    for activity_type in ActivityType.objects.filter(is_active=True).select_related('goal__category'):
         config_map[activity_type.data_variable] = {
             'base_points': activity_type.base_points,
             'modifier_type': activity_type.modifier_type,
@@ -41,17 +66,18 @@ def get_legacy_point_values() -> Dict[str, int]:
     Returns:
         Dict mapping internal point key to base point value
     """
-    point_values = {}
-    for activity_type in ActivityType.objects.filter(is_active=True):
-        # Use data_variable as key (matches src/config.py format)
-        point_values[activity_type.data_variable] = activity_type.base_points
-    return point_values
+    # Use data_variable as key (matches src/config.py format)
+    return {
+        data_variable: config['base_points']
+        for data_variable, config in get_point_config_map().items()
+    }
 
 
 def calculate_activity_points(
     activity_type: str,
     count: int = 1,
-    impact_factor: Optional[float] = None
+    impact_factor: Optional[float] = None,
+    config_map: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> int:
     """
     Calculate points for an activity using database configuration.
@@ -60,104 +86,208 @@ def calculate_activity_points(
         activity_type: The data_variable/type identifier
         count: Number of items (for count-based activities)
         impact_factor: Impact factor (for IF-based activities)
+        config_map: Point configuration from get_point_config_map(); looked
+            up (memoized) when omitted
 
     Returns:
         Calculated point value
     """
-    try:
-        config = ActivityType.objects.get(data_variable=activity_type, is_active=True)
-    except ActivityType.DoesNotExist:
+    if config_map is None:
+        config_map = get_point_config_map()
+
+    config = config_map.get(activity_type)
+    if config is None:
         return 0
 
-    if config.modifier_type == 'fixed':
-        points = config.base_points
-    elif config.modifier_type == 'count':
-        effective_count = count
-        if config.max_count:
-            effective_count = min(count, config.max_count)
-        points = config.base_points * effective_count
-    elif config.modifier_type == 'impact_factor':
-        if impact_factor is not None:
-            # Cap impact factor at max (typically 15)
-            capped_if = min(impact_factor, 15.0)
-            points = int(config.base_points * capped_if)
-        else:
-            points = config.base_points
-    else:
-        points = config.base_points
+    return _points_from_config(config, count, impact_factor)
+
+
+def _fixed_points(config: Dict[str, Any], count: int, impact_factor: Optional[float]) -> int:
+    return config['base_points']
+
+
+def _count_points(config: Dict[str, Any], count: int, impact_factor: Optional[float]) -> int:
+    if config['max_count']:
+        count = min(count, config['max_count'])
+    return config['base_points'] * count
+
+
+def _impact_factor_points(config: Dict[str, Any], count: int, impact_factor: Optional[float]) -> int:
+    if impact_factor is None:
+        return config['base_points']
+    # Cap impact factor at max (typically 15)
+    return int(config['base_points'] * min(impact_factor, 15.0))
+
+
+# modifier_type -> points before the max_points cap; calculate_activity_points
+# scores unknown types as fixed
+_MODIFIER_HANDLERS = {
+    'fixed': _fixed_points,
+    'count': _count_points,
+    'impact_factor': _impact_factor_points,
+}
+
+
+def _points_from_config(
+    config: Dict[str, Any],
+    count: int = 1,
+    impact_factor: Optional[float] = None
+) -> int:
+    """Apply an ActivityType config entry's modifier and caps."""
+    handler = _MODIFIER_HANDLERS.get(config['modifier_type'], _fixed_points)
+    points = handler(config, count, impact_factor)
 
     # Apply max_points cap if set
-    if config.max_points:
-        points = min(points, config.max_points)
+    if config['max_points']:
+        points = min(points, config['max_points'])
 
     return points
 
 
-def recalculate_survey_points(survey_data) -> Dict[str, Any]:
+def recalculate_survey_points(survey_data, annotate: bool = True) -> Dict[str, Any]:
     """
     Recalculate all points for a FacultySurveyData record using current DB config.
 
     Args:
         survey_data: FacultySurveyData instance
+        annotate: Return copies of the activity blobs with a
+            'calculated_points' field on each entry. Pass False when only
+            the totals are needed; the blobs are then left uncopied and
+            untouched.
 
     Returns:
         Dict with recalculated totals and updated activities
     """
-    from copy import deepcopy
-
-    activities = deepcopy(survey_data.activities_json or {})
-    manual = deepcopy(survey_data.manual_activities_json or {})
+    activities = survey_data.activities_json or {}
+    manual = survey_data.manual_activities_json or {}
+    if annotate:
+        # The blobs are plain JSON, so a round-trip through the C encoder
+        # is a much cheaper copy than deepcopy
+        activities = json.loads(json.dumps(activities))
+        manual = json.loads(json.dumps(manual))
 
     # Get current point configuration
     config_map = get_point_config_map()
 
-    totals = {
-        'citizenship': 0,
-        'education': 0,
-        'research': 0,
-        'leadership': 0,
-        'content_expert': 0,
-        'total': 0,
+    # Manual activities only ever store lists of entries
+    entries = chain(
+        _walk_entries(activities, single_entries=True),
+        _walk_entries(manual, single_entries=False),
+    )
+    category_points = defaultdict(int)
+    for category, subcat, entry in entries:
+        points = _calculate_entry_points(entry, subcat, config_map)
+        if annotate:
+            entry['calculated_points'] = points
+        category_points[category] += points
+
+    totals = {category: category_points[category] for category in POINT_CATEGORIES}
+    totals['total'] = sum(totals.values())
+
+    return {
+        'activities': activities,
+        'manual_activities': manual,
+        'totals': totals,
     }
 
-    # Process imported activities
-    for category, subcats in activities.items():
-        if not isinstance(subcats, dict):
-            continue
-        for subcat, entries in subcats.items():
-            if isinstance(entries, list):
-                for entry in entries:
-                    points = _calculate_entry_points(entry, subcat, config_map)
-                    entry['calculated_points'] = points
-                    if category in totals:
-                        totals[category] += points
-            elif isinstance(entries, dict):
-                # Single entry (like evaluations)
-                points = _calculate_entry_points(entries, subcat, config_map)
-                entries['calculated_points'] = points
-                if category in totals:
-                    totals[category] += points
-
-    # Process manual activities
-    for category, subcats in manual.items():
+
+def _walk_entries(tree: Dict, single_entries: bool) -> Iterator[Tuple[str, str, Dict]]:
+    """
+    Yield (category, subcat, entry) for every entry in an activities blob.
+
+    With single_entries, a subcat holding one dict (like evaluations) is
+    yielded as an entry rather than skipped.
+    """
+    for category, subcats in tree.items():
         if not isinstance(subcats, dict):
             continue
         for subcat, entries in subcats.items():
             if isinstance(entries, list):
                 for entry in entries:
-                    points = _calculate_entry_points(entry, subcat, config_map)
-                    entry['calculated_points'] = points
-                    if category in totals:
-                        totals[category] += points
+                    yield category, subcat, entry
+            elif single_entries and isinstance(entries, dict):
+                yield category, subcat, entries
 
-    # Calculate grand total
-    totals['total'] = sum(totals.get(k, 0) for k in ['citizenship', 'education', 'research', 'leadership', 'content_expert'])
 
-    return {
-        'activities': activities,
-        'manual_activities': manual,
-        'totals': totals,
-    }
+# Categories totalled by recalculate_survey_points
+POINT_CATEGORIES = ('citizenship', 'education', 'research', 'leadership', 'content_expert')
+
+# FacultySurveyData field for each category total in recalculate_survey_points
+SURVEY_POINT_FIELDS = {
+    'citizenship': 'citizenship_points',
+    'education': 'education_points',
+    'research': 'research_points',
+    'leadership': 'leadership_points',
+    'content_expert': 'content_expert_points',
+    'total': 'survey_total_points',
+}
+
+
+def recalculate_all_survey_points(academic_year, batch_size: int = 500) -> int:
+    """
+    Recalculate stored point totals for every survey record in a year.
+
+    Totals are computed in Python against a single config map and written
+    back with bulk_update, one batch of batch_size records at a time. Each
+    batch is fully fetched before its UPDATE runs: on SQLite, writing to a
+    table while a cursor over it is still open gives no isolation.
+
+    Args:
+        academic_year: AcademicYear instance
+        batch_size: Rows per fetch and per UPDATE batch
+
+    Returns:
+        Number of records whose totals changed
+    """
+    from django.utils import timezone
+    from .models import FacultySurveyData
+
+    # Warm the memoized map once for the whole batch
+    get_point_config_map()
+    update_fields = list(SURVEY_POINT_FIELDS.values()) + ['updated_at']
+
+    ids = list(
+        FacultySurveyData.objects
+        .filter(academic_year=academic_year)
+        .order_by('pk')
+        .values_list('pk', flat=True)
+    )
+
+    updated = 0
+    now = timezone.now()
+    for start in range(0, len(ids), batch_size):
+        batch = (
+            FacultySurveyData.objects
+            .only('id', 'activities_json', 'manual_activities_json', *SURVEY_POINT_FIELDS.values())
+            .in_bulk(ids[start:start + batch_size])
+        )
+
+        changed_rows = []
+        for survey_data in batch.values():
+            totals = recalculate_survey_points(survey_data, annotate=False)['totals']
+            changed = False
+            for category, field in SURVEY_POINT_FIELDS.items():
+                if getattr(survey_data, field) != totals[category]:
+                    setattr(survey_data, field, totals[category])
+                    changed = True
+            if changed:
+                survey_data.updated_at = now
+                changed_rows.append(survey_data)
+
+        if changed_rows:
+            FacultySurveyData.objects.bulk_update(changed_rows, update_fields)
+            updated += len(changed_rows)
+
+    return updated
+
+
+# (subcat, entry type) -> data_variable for imported entries without one
+_ENTRY_TYPE_MAP = {
+    ('committees', 'unmc'): 'COMM_UNMC',
+    ('committees', 'nebmed'): 'COMM_NEBMED',
+    ('committees', 'minor'): 'COMM_MINOR',
+    ('evaluations', 'completed'): 'EVAL_80_COMPLETION',
+}
 
 
 def _calculate_entry_points(entry: Dict, subcat: str, config_map: Dict) -> int:
@@ -165,61 +295,31 @@ def _calculate_entry_points(entry: Dict, subcat: str, config_map: Dict) -> int:
     Calculate points for a single activity entry.
 
     Uses the entry's type field to look up the point configuration.
-    Falls back to the existing 'points' field if no config found.
+    Falls back to the existing 'points' field if no config (or no known
+    modifier_type) is found.
     """
-    # Try to find the activity type
-    entry_type = entry.get('type', '')
-
-    # Common type mappings from subcat
-    type_mappings = {
-        'committees': {
-            'unmc': 'COMM_UNMC',
-            'nebmed': 'COMM_NEBMED',
-            'minor': 'COMM_MINOR',
-        },
-        'evaluations': {
-            'completed': 'EVAL_80_COMPLETION',
-        },
-    }
-
-    # Try to find matching config
-    data_var = None
-
-    # Check if entry has a data_variable field (for manually added)
+    # Manually added entries carry their data_variable; otherwise map from type
     if 'data_variable' in entry:
         data_var = entry['data_variable']
-    # Try to map from type field
-    elif subcat in type_mappings and entry_type in type_mappings[subcat]:
-        data_var = type_mappings[subcat][entry_type]
-
-    # Look up in config
-    if data_var and data_var in config_map:
-        config = config_map[data_var]
-
-        if config['modifier_type'] == 'fixed':
-            return config['base_points']
-        elif config['modifier_type'] == 'count':
-            count = entry.get('count', 1)
-            if config['max_count']:
-                count = min(count, config['max_count'])
-            points = config['base_points'] * count
-            if config['max_points']:
-                points = min(points, config['max_points'])
-            return points
-        elif config['modifier_type'] == 'impact_factor':
-            if_value = entry.get('impact_factor', 1)
-            try:
-                if_value = float(if_value)
-            except (TypeError, ValueError):
-                if_value = 1
-            if_value = min(if_value, 15.0)
-            points = int(config['base_points'] * if_value)
-            if config['max_points']:
-                points = min(points, config['max_points'])
-            return points
-
-    # Fallback to existing points field
-    return entry.get('points', 0)
+    else:
+        data_var = _ENTRY_TYPE_MAP.get((subcat, entry.get('type', '')))
+
+    config = config_map.get(data_var) if data_var else None
+    modifier_type = config['modifier_type'] if config else None
+    if modifier_type == 'fixed':
+        # Fixed survey entries score base_points without the max_points cap
+        return config['base_points']
+    if modifier_type not in _MODIFIER_HANDLERS:
+        # No config (or an unknown modifier): keep the existing points field
+        return entry.get('points', 0)
+
+    if_value = None
+    if modifier_type == 'impact_factor':
+        try:
+            if_value = float(entry.get('impact_factor', 1))
+        except (TypeError, ValueError):
+            if_value = 1
+    return _points_from_config(config, entry.get('count', 1), if_value)
 
 
 def get_departmental_point_values() -> Dict[str, int]:
@@ -229,8 +329,6 @@ def get_departmental_point_values() -> Dict[str, int]:
     Returns:
         Dict mapping field name to point value
     """
-    dept_activities = ActivityType.objects.filter(is_departmental=True, is_active=True)
-
     # Map data_variable patterns to DepartmentalData field names
     field_mappings = {
         'DEPT_CCC_MEMBER': 'ccc_member',
@@ -244,10 +342,12 @@ def get_departmental_point_values() -> Dict[str, int]:
     }
 
     values = {}
-    for activity in dept_activities:
-        field_name = field_mappings.get(activity.data_variable)
+    for data_variable, config in get_point_config_map().items():
+        if not config['is_departmental']:
+            continue
+        field_name = field_mappings.get(data_variable)
         if field_name:
-            values[field_name] = activity.base_points
+            values[field_name] = config['base_points']
 
     return values
 
@@ -263,7 +363,7 @@ def get_category_totals(survey_data, include_departmental: bool = True) -> Dict[
     Returns:
         Dict with category totals and grand total
     """
-    result = recalculate_survey_points(survey_data)
+    result = recalculate_survey_points(survey_data, annotate=False)
     totals = result['totals']
 
     if include_departmental and hasattr(survey_data, 'faculty'):
@@ -56,12 +56,19 @@ class FacultyRouter:
 
     def allow_relation(self, obj1, obj2, **hints):
         """
-        Allow relations between objects in different databases.
+        Allow relations to FacultyMember across databases.
 
         This is necessary because FacultySurveyData and DepartmentalData
         have foreign keys to FacultyMember, which may be in a different database.
+        Other relations fall through to Django's same-database default.
+
+        Django cannot JOIN across databases, so select_related('faculty') is
+        not available once this router is enabled: load faculty for many rows
+        with prefetch_related('faculty') or FacultyMember.objects.in_bulk().
         """
-        return True
+        if 'FacultyMember' in (obj1.__class__.__name__, obj2.__class__.__name__):
+            return True
+        return None
 
     def allow_migrate(self, db, app_label, model_name=None, **hints):
         """
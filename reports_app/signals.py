@@ -0,0 +1,20 @@
+"""
+Signal handlers for reports_app.
+
+Keeps the memoized point configuration in points_utils in sync with
+edits made through the config pages or the admin.
+"""
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import ActivityCategory, ActivityGoal, ActivityType
+from .points_utils import invalidate_point_config_cache
+
+
+@receiver([post_save, post_delete], sender=ActivityType)
+@receiver([post_save, post_delete], sender=ActivityGoal)
+@receiver([post_save, post_delete], sender=ActivityCategory)
+def point_config_changed(sender, **kwargs):
+    """Drop the cached point config map when any part of it changes."""
+    invalidate_point_config_cache()
@@ -1,3 +1,314 @@
-from django.test import TestCase
+import json
+from datetime import date
+from unittest import mock
+from urllib.parse import unquote
 
-# Create your tests here.
+from django.test import SimpleTestCase, TestCase
+
+from src import config, parser
+
+from . import doi_lookup
+from .models import (
+    AcademicYear, ActivityCategory, ActivityGoal, ActivityType,
+    FacultyMember, FacultySurveyData,
+)
+from .points_utils import (
+    _calculate_entry_points, invalidate_point_config_cache, recalculate_all_survey_points,
+)
+
+
+# Repeating sections in survey export order: (category, subcategory, type
+# column, fields, points pattern, max entries, type mapping). Several of them
+# share labels ("Your role", "Date", "Points for Role #1", ...), which is what
+# the header-layout placement in parser.section_plan has to untangle.
+SECTION_LAYOUT = [
+    ("citizenship", "committees", "Committee type",
+     ["Committee type", "Committee name", "Your role (member, chair, etc.)"],
+     "Points for Committee #", 5, config.COMMITTEE_TYPES),
+    ("citizenship", "department_activities", "Activity type",
+     ["Activity type", "Date of activity", "Name of Visiting Professor, Shadow Student, or Topic"],
+     "Points for Activity #", 15, config.DEPARTMENT_ACTIVITY_TYPES),
+    ("education", "lectures", "Lecture/curriculum type",
+     ["Lecture/curriculum type", "Lecture title", "Date delivered"],
+     "Points for Lecture #", 8, config.LECTURE_TYPES),
+    ("education", "board_prep", "Board prep activity type",
+     ["Board prep activity type", "Date of activity", "Location"],
+     "Points for Activity #", 5, config.BOARD_PREP_TYPES),
+    ("education", "mentorship", "Mentorship type",
+     ["Mentorship type", "Trainee name", "Title of poster/abstract/presentation/publication",
+      "Meeting/journal name", "Date"],
+     "Points for Activity #", 5, config.MENTORSHIP_TYPES),
+    ("research", "grant_awards", "Award level",
+     ["Award level", "Grant title", "PI name (if not you)", "Funding agency"],
+     "Points for Award #", 5, config.GRANT_AWARD_LEVELS),
+    ("research", "grant_submissions", "Submission type/outcome",
+     ["Submission type/outcome", "Grant title", "Agency", "Submission date"],
+     "Points for Submission #", 5, config.GRANT_SUBMISSION_TYPES),
+    ("research", "thesis_committees", "Graduate student name",
+     ["Graduate student name", "Program/degree (PhD, MS, etc.)", "Thesis/dissertation title"],
+     "Points for Committee #", 3, None),
+    ("leadership", "education_leadership", "Leadership role type",
+     ["Leadership role type", "Course/workshop/guideline name", "Date (first day if multi-day)"],
+     "Points for Role #", 5, config.EDUCATION_LEADERSHIP_TYPES),
+    ("leadership", "society_leadership", "Society role type",
+     ["Society role type", "Society/organization name"],
+     "Points for Role #", 5, config.SOCIETY_LEADERSHIP_TYPES),
+    ("leadership", "board_leadership", "Board role type",
+     ["Board role type", "Board/organization name"],
+     "Points for Role #", 5, config.BOARD_LEADERSHIP_TYPES),
+    ("content_expert", "speaking", "Speaking type",
+     ["Speaking type", "Title of talk/workshop", "Conference/meeting name", "Date", "Location"],
+     "Points for Event #", 15, config.SPEAKING_TYPES),
+    ("content_expert", "publications_peer", "Your role",
+     ["Your role", "Publication title", "Journal name", "Journal Impact Factor (max 15)",
+      "Publication date", "DOI"],
+     "Points for Publication #", 5, config.PUBLICATION_ROLES),
+    ("content_expert", "publications_nonpeer", "Your role",
+     ["Your role", "Publication title", "Journal/newsletter/outlet", "Publication date"],
+     "Points for Publication #", 3, config.PUBLICATION_ROLES),
+    ("content_expert", "pathways", "Pathway activity",
+     ["Pathway activity", "Pathway name", "What Division oversees this Pathway?"],
+     "Points for Pathway #", 3, config.PATHWAY_TYPES),
+    ("content_expert", "textbooks", "Your role",
+     ["Your role", "Textbook title", "Section name", "Chapter title (if applicable)"],
+     "Points for Contribution #", 3, config.TEXTBOOK_ROLES),
+    ("content_expert", "abstracts", "Your role",
+     ["Your role", "Abstract/poster title", "Meeting (MARC, ASA, SCA, etc.)", "Date", "Location"],
+     "Points for Abstract #", 5, config.ABSTRACT_ROLES),
+    ("content_expert", "journal_editorial", "Editorial role",
+     ["Editorial role", "Journal name"],
+     "Points for Role #", 3, config.JOURNAL_EDITORIAL_TYPES),
+]
+
+
+def _first_choice(mapping):
+    """A survey label that maps to an activity (not a "none/mistake" answer)."""
+    if mapping is None:
+        return "Student A"
+    return next(label for label, value in mapping.items() if value is not None)
+
+
+class SectionLayoutTests(SimpleTestCase):
+    """Repeating sections are read from their own columns in a full export."""
+
+    def build_export(self):
+        headers = ["Record ID", "First name", "Last name", "UNMC email address",
+                   "Which quarter are you reporting?"]
+        values = {0: "1", 1: "Ada", 2: "Lovelace", 3: "ada@unmc.edu", 4: "Q3"}
+        expected = {}
+
+        for n_section, (category, subcat, type_col, fields, points_pattern,
+                        max_entries, mapping) in enumerate(SECTION_LAYOUT):
+            type_value = _first_choice(mapping)
+            field_key = parser.get_field_key(fields[1])
+            # Fill the first and last entry so both ends of the block are pinned
+            filled_entries = (1, max_entries)
+            expected_entries = []
+            for entry_num in range(1, max_entries + 1):
+                filled = entry_num in filled_entries
+                for field in fields:
+                    if filled and field == type_col:
+                        values[len(headers)] = type_value
+                    elif filled and field == fields[1]:
+                        values[len(headers)] = f"{subcat} #{entry_num}"
+                    headers.append(field)
+                if filled:
+                    points = 100 * n_section + entry_num
+                    values[len(headers)] = str(points)
+                    expected_entries.append((type_value, f"{subcat} #{entry_num}", points))
+                headers.append(f"{points_pattern}{entry_num}")
+            headers.append("Complete?")
+            expected[(category, subcat)] = (field_key, expected_entries)
+
+        headers += list(config.TOTAL_COLUMNS)
+        headers.append("Complete?")
+        values[len(headers) - 1] = "Complete"
+
+        row = [values.get(i, "") for i in range(len(headers))]
+        return headers, row, expected
+
+    def test_each_section_reads_its_own_columns(self):
+        headers, row, expected = self.build_export()
+        col_index = parser.build_column_index(headers)
+        submission = parser.parse_row_indexed(row, col_index)
+
+        for (category, subcat), (field_key, expected_entries) in expected.items():
+            with self.subTest(section=subcat):
+                entries = submission["activities"][category][subcat]
+                self.assertEqual(
+                    [(e["type"], e.get(field_key), e.get("points")) for e in entries],
+                    expected_entries,
+                )
+
+    def test_unplaceable_entry_does_not_drop_later_entries(self):
+        headers = ["Type", "Name", "Points for Thing #1",
+                   "Type", "Name2", "Points for Thing #2",
+                   "Type", "Name", "Points for Thing #3", "Complete?"]
+        row = ["A", "n1", "1", "B", "x", "2", "C", "n3", "3", "Complete"]
+        col_index = parser.build_column_index(headers)
+
+        entries = parser.parse_repeating_indexed(
+            row, col_index, "Type", ["Type", "Name"], "Points for Thing #", 3
+        )
+
+        self.assertEqual(
+            [(e["type"], e.get("name"), e["points"]) for e in entries],
+            [("A", "n1", 1), ("C", "n3", 3)],
+        )
+
+
+class EntryPointsTests(SimpleTestCase):
+    """Survey entry scoring in points_utils._calculate_entry_points."""
+
+    def config(self, modifier_type, base_points=100, max_points=None):
+        return {
+            'base_points': base_points,
+            'modifier_type': modifier_type,
+            'max_count': None,
+            'max_points': max_points,
+        }
+
+    def test_fixed_entries_are_not_capped(self):
+        config_map = {'COMM_UNMC': self.config('fixed', base_points=100, max_points=50)}
+        entry = {'type': 'unmc', 'points': 10}
+
+        self.assertEqual(_calculate_entry_points(entry, 'committees', config_map), 100)
+
+    def test_unknown_modifier_keeps_stored_points(self):
+        config_map = {'COMM_UNMC': self.config('per_hour', base_points=100)}
+        entry = {'type': 'unmc', 'points': 10}
+
+        self.assertEqual(_calculate_entry_points(entry, 'committees', config_map), 10)
+
+    def test_count_entries_are_capped(self):
+        config_map = {'SPEAK': self.config('count', base_points=100, max_points=250)}
+        entry = {'data_variable': 'SPEAK', 'count': 4}
+
+        self.assertEqual(_calculate_entry_points(entry, 'speaking', config_map), 250)
+
+
+class BatchDoiLookupTests(SimpleTestCase):
+    """doi_lookup._batch_lookup_dois isolates DOIs a batch query can't handle."""
+
+    def response(self, status_code, payload=None):
+        return mock.Mock(status_code=status_code, content=json.dumps(payload or {}).encode())
+
+    def fake_get(self, batch_status):
+        def get(url, params=None, **kwargs):
+            if params and "filter" in params:
+                self.batch_filters.append(params["filter"])
+                return self.response(batch_status, {"message": {"items": []}})
+            doi = unquote(url.rsplit("/works/", 1)[1])
+            return self.response(200, {"message": {"DOI": doi, "title": [f"Title {doi}"]}})
+        return get
+
+    def setUp(self):
+        self.batch_filters = []
+
+    def test_failed_batch_is_retried_one_at_a_time(self):
+        dois = ["10.1/a", "10.1/b"]
+        with mock.patch.object(doi_lookup, "_get", side_effect=self.fake_get(500)):
+            results = doi_lookup._batch_lookup_dois(dois)
+
+        self.assertEqual(self.batch_filters, ["doi:10.1/a,doi:10.1/b"])
+        self.assertEqual(sorted(results), dois)
+        self.assertEqual(results["10.1/a"]["title"], "Title 10.1/a")
+
+    def test_unbatchable_dois_stay_out_of_the_filter(self):
+        dois = ["10.1/a", "10.1/b,c", "not a doi"]
+        with mock.patch.object(doi_lookup, "_get", side_effect=self.fake_get(200)):
+            results = doi_lookup._batch_lookup_dois(dois)
+
+        self.assertEqual(self.batch_filters, ["doi:10.1/a"])
+        self.assertEqual(sorted(results), sorted(dois))
+
+
+class RecalculateAllSurveyPointsTests(TestCase):
+    """points_utils.recalculate_all_survey_points writes refreshed totals."""
+
+    def setUp(self):
+        invalidate_point_config_cache()
+        category = ActivityCategory.objects.create(name='citizenship', display_name='Citizenship')
+        goal = ActivityGoal.objects.create(category=category, name='committees', display_name='Committees')
+        ActivityType.objects.create(
+            goal=goal, name='UNMC committee', display_name='UNMC committee',
+            data_variable='COMM_UNMC', base_points=100,
+        )
+        self.year = AcademicYear.objects.create(
+            year_code='24-25', start_date=date(2024, 7, 1), end_date=date(2025, 6, 30)
+        )
+        self.other_year = AcademicYear.objects.create(
+            year_code='23-24', start_date=date(2023, 7, 1), end_date=date(2024, 6, 30)
+        )
+
+    def tearDown(self):
+        invalidate_point_config_cache()
+
+    def survey(self, email, year, committees, citizenship_points):
+        faculty = FacultyMember.objects.create(email=email, first_name='A', last_name=email)
+        return FacultySurveyData.objects.create(
+            faculty=faculty,
+            academic_year=year,
+            activities_json={'citizenship': {'committees': [{'type': 'unmc'}] * committees}},
+            citizenship_points=citizenship_points,
+            survey_total_points=citizenship_points,
+        )
+
+    def test_updates_changed_rows_in_batches(self):
+        current = self.survey('current@unmc.edu', self.year, 1, 100)
+        stale = self.survey('stale@unmc.edu', self.year, 2, 0)
+        removed = self.survey('removed@unmc.edu', self.year, 0, 50)
+        other = self.survey('other@unmc.edu', self.other_year, 3, 0)
+
+        updated = recalculate_all_survey_points(self.year, batch_size=2)
+
+        self.assertEqual(updated, 2)
+        totals = {
+            sd.pk: (sd.citizenship_points, sd.survey_total_points)
+            for sd in FacultySurveyData.objects.all()
+        }
+        self.assertEqual(totals[current.pk], (100, 100))
+        self.assertEqual(totals[stale.pk], (200, 200))
+        self.assertEqual(totals[removed.pk], (0, 0))
+        self.assertEqual(totals[other.pk], (0, 0))
+
+
+class PaddedCellTests(SimpleTestCase):
+    """The parser strips the cells it reads, so padded exports parse like clean ones."""
+
+    def test_padded_values_are_stripped(self):
+        headers = ["Record ID", "First name", "Last name", "UNMC email address",
+                   "Which quarter are you reporting?",
+                   "Committee type", "Committee name", "Your role (member, chair, etc.)",
+                   "Points for Committee #1", "Complete?"]
+        committee_type = _first_choice(config.COMMITTEE_TYPES)
+        row = ["1", " Ada ", "Lovelace  ", " ADA@unmc.edu ", " Q3 ",
+               f"  {committee_type} ", " Curriculum ", " Chair ", " 250 ", " Complete "]
+
+        submission = parser.parse_row_indexed(row, parser.build_column_index(headers))
+
+        self.assertEqual(
+            (submission["first_name"], submission["last_name"], submission["email"], submission["quarter"]),
+            ("Ada", "Lovelace", "ada@unmc.edu", "Q3"),
+        )
+        self.assertEqual(
+            [(e["type"], e["name"], e["role"], e["points"])
+             for e in submission["activities"]["citizenship"]["committees"]],
+            [(committee_type, "Curriculum", "Chair", 250)],
+        )
+
+
+class LookupChoiceTests(SimpleTestCase):
+    """parser.lookup_choice canonical matching."""
+
+    def test_config_table_matches_label_variants(self):
+        label = _first_choice(config.COMMITTEE_TYPES)
+        self.assertEqual(
+            parser.lookup_choice(config.COMMITTEE_TYPES, f"  {label.upper()} "),
+            config.COMMITTEE_TYPES[label],
+        )
+
+    def test_caller_tables_do_not_share_canonical_forms(self):
+        # Short-lived dicts often reuse the same id(); each must use its own labels
+        self.assertEqual(parser.lookup_choice({"Chair": 1}, "chair"), 1)
+        self.assertEqual(parser.lookup_choice({"Member": 2}, "member"), 2)
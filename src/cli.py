@@ -8,31 +8,31 @@ This CLI provides:
 - Activity-type report export
 """
 
-import os
+import re
 import sys
 import click
+from functools import lru_cache
+from importlib.util import find_spec
+from itertools import groupby
+from pathlib import Path
 from typing import List, Optional
 
-try:
-    from rich.console import Console
-    from rich.table import Table
-    from rich.prompt import Prompt, Confirm
-    from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
-
-from datetime import datetime
-from . import parser, reports, pdf_generator, config
+# rich (and the parser/report/PDF modules) are imported inside the commands
+# that use them, so `--help` and the listing commands start quickly
+RICH_AVAILABLE = find_spec("rich") is not None
 
 
+@lru_cache(maxsize=1)
 def get_academic_year():
     """
     Determine the academic year based on current date.
     Academic year runs July-June.
     Returns format like '25-26' for 2025-2026 academic year.
+    Computed once per process; batch exports that fan out to worker
+    processes compute it in the parent and pass it down.
     """
+    from datetime import datetime
+
     today = datetime.now()
     if today.month >= 7:  # July-December = first half of academic year
         start_year = today.year
@@ -43,83 +43,203 @@ def get_academic_year():
     return f"{start_year % 100:02d}-{end_year % 100:02d}"
 
 
-def make_faculty_filename(display_name, suffix="Summary"):
+# "Last, First" -> "Last_First" in one pass: drop commas, spaces become underscores
+_FILENAME_CHARS = str.maketrans({",": None, " ": "_"})
+
+
+def make_faculty_filename(display_name, suffix="Summary", academic_year=None):
     """
     Create filename for faculty export.
     Format: LastName_FirstName_AVC_YY-YY_Summary
     """
-    academic_year = get_academic_year()
-    safe_name = display_name.replace(', ', '_').replace(' ', '_')
+    academic_year = academic_year or get_academic_year()
+    safe_name = display_name.translate(_FILENAME_CHARS)
     return f"{safe_name}_AVC_{academic_year}_{suffix}"
 
 
-# Initialize rich console if available
-console = Console() if RICH_AVAILABLE else None
+_console = None
 
 
-def print_msg(msg: str, style: str = None):
-    """Print message using rich if available, else plain print."""
-    if console and style:
-        console.print(msg, style=style)
-    elif console:
-        console.print(msg)
-    else:
+def get_console():
+    """Return the shared rich Console (created on first use), or None."""
+    global _console
+    if _console is None and RICH_AVAILABLE:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+# The rich/plain choice is made once here rather than on every message
+if RICH_AVAILABLE:
+    def print_msg(msg: str, style: str = None):
+        """Print message using rich if available, else plain print."""
+        get_console().print(msg, style=style)
+else:
+    def print_msg(msg: str, style: str = None):
+        """Print message using rich if available, else plain print."""
         print(msg)
 
 
-def print_error(msg: str):
-    """Print error message."""
-    print_msg(f"Error: {msg}", style="bold red")
+def _styled_printer(prefix: str, style: str, doc: str):
+    """Build a print_* helper bound to one prefix and style."""
+    if RICH_AVAILABLE:
+        def printer(msg: str):
+            get_console().print(f"{prefix}{msg}", style=style)
+    else:
+        def printer(msg: str):
+            print(f"{prefix}{msg}")
+    printer.__doc__ = doc
+    return printer
+
+
+# Characters json.dumps escapes under its default ensure_ascii=True
+_JSON_NON_ASCII = re.compile(r'[^\x00-\x7e]')
+
 
+def _json_escape(match) -> str:
+    """\\uXXXX escape (a surrogate pair above the BMP) as json.dumps writes it."""
+    code = ord(match.group())
+    if code > 0xFFFF:
+        code -= 0x10000
+        return "\\u{:04x}\\u{:04x}".format(0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF))
+    return "\\u{:04x}".format(code)
 
-def print_success(msg: str):
-    """Print success message."""
-    print_msg(f"✓ {msg}", style="bold green")
+
+def print_json(items):
+    """
+    Write an iterable of dicts to stdout as an indented JSON array.
+
+    Elements are serialised and written one at a time (with orjson when
+    installed), so generators are never materialised; the output matches
+    json.dumps(list(items), indent=2) byte for byte, non-ASCII text
+    included, so it is safe on any stdout encoding.
+    """
+    try:
+        import orjson
+
+        def dumps(item):
+            text = orjson.dumps(item, option=orjson.OPT_INDENT_2).decode()
+            return _JSON_NON_ASCII.sub(_json_escape, text)
+    except ImportError:
+        import json
+
+        def dumps(item):
+            return json.dumps(item, indent=2)
+
+    write = sys.stdout.write
+    first = True
+    for item in items:
+        write("[\n  " if first else ",\n  ")
+        write(dumps(item).replace("\n", "\n  "))
+        first = False
+    write("[]\n" if first else "\n]\n")
 
 
-def print_info(msg: str):
-    """Print info message."""
-    print_msg(msg, style="cyan")
+print_error = _styled_printer("Error: ", "bold red", "Print error message.")
+print_success = _styled_printer("✓ ", "bold green", "Print success message.")
+print_info = _styled_printer("", "cyan", "Print info message.")
+
+
+def resolve_faculty(faculty_list: List[dict], patterns) -> List[str]:
+    """
+    Map --faculty arguments to emails.
+
+    An exact (case-insensitive) email match wins; otherwise the first
+    faculty member whose display name contains the pattern is used.
+    Patterns matching nobody are skipped.
+    """
+    by_email = {fac["email"].lower(): fac["email"] for fac in faculty_list}
+    names = [(fac["display_name"].lower(), fac["email"]) for fac in faculty_list]
+
+    selected = []
+    for pattern in patterns:
+        pattern_lower = pattern.lower()
+        if pattern_lower in by_email:
+            selected.append(by_email[pattern_lower])
+            continue
+        for name_lower, email in names:
+            if pattern_lower in name_lower:
+                selected.append(email)
+                break
+    return selected
+
+
+def select_faculty(faculty_data: dict, patterns) -> List[str]:
+    """
+    Resolve --faculty arguments against parsed faculty data.
+
+    When every pattern is an email address they are looked up directly
+    (faculty_data is keyed by lowercased email); name patterns need the
+    sorted faculty list for resolve_faculty's substring matching.
+    """
+    from . import parser
+
+    if all("@" in pattern for pattern in patterns):
+        emails = (pattern.strip().lower() for pattern in patterns)
+        return [email for email in emails if email in faculty_data]
+    return resolve_faculty(parser.get_faculty_list(faculty_data), patterns)
+
+
+# Checked and resolved once by click, so commands get an absolute Path
+CSV_PATH = click.Path(exists=True, dir_okay=False, path_type=Path, resolve_path=True)
 
 
 @click.group()
 @click.version_option(version="0.1.0")
-def cli():
+@click.option('--no-cache', is_flag=True,
+              help='Always re-parse the CSV instead of reusing a cached parse. The cache '
+                   'keeps one pickle per CSV path in $XDG_CACHE_HOME/aaa-summarizer '
+                   '(default ~/.cache/aaa-summarizer); delete it to clear')
+@click.pass_context
+def cli(ctx, no_cache: bool):
     """
     Academic Achievement Award Summarizer
 
     Process REDCap CSV exports and generate faculty activity reports.
     """
-    pass
+    ctx.obj = {"no_cache": no_cache}
+
+
+def load_csv(csv_file: Path) -> dict:
+    """Parse the CSV, reusing the on-disk parse cache unless --no-cache was given."""
+    from . import parser
+
+    ctx = click.get_current_context(silent=True)
+    if ctx and ctx.find_root().params.get("no_cache"):
+        return parser.parse_csv(csv_file)
+    return parser.parse_csv_cached(csv_file)
 
 
 @cli.command()
-@click.argument('csv_file', type=click.Path(exists=True))
+@click.argument('csv_file', type=CSV_PATH)
 @click.option('--json', 'as_json', is_flag=True, help='Output as JSON for programmatic use')
-def list_faculty(csv_file: str, as_json: bool):
+def list_faculty(csv_file: Path, as_json: bool):
     """List all faculty members in the CSV file."""
-    import json as json_module
+    from . import parser
 
     if not as_json:
         print_info(f"Loading: {csv_file}")
 
-    data = parser.parse_csv(csv_file)
-    faculty_list = parser.get_faculty_list(data["faculty"])
+    data = load_csv(csv_file)
 
     if as_json:
-        output = []
-        for fac in faculty_list:
-            output.append({
+        print_json(
+            {
                 "name": fac["display_name"],
                 "email": fac["email"],
                 "quarters": ", ".join(fac["quarters"]),
                 "points": fac["total_points"],
                 "status": "INCOMPLETE" if fac["has_incomplete"] else "Complete"
-            })
-        print(json_module.dumps(output, indent=2))
+            }
+            for fac in parser.iter_faculty_summaries(data["faculty"])
+        )
         return
 
+    faculty_list = parser.get_faculty_list(data["faculty"])
+
     if RICH_AVAILABLE:
+        from rich.table import Table
+
         table = Table(title="Faculty Members")
         table.add_column("#", style="dim")
         table.add_column("Name")
@@ -140,7 +260,7 @@ def list_faculty(csv_file: str, as_json: bool):
                 status
             )
 
-        console.print(table)
+        get_console().print(table)
     else:
         print("\nFaculty Members:")
         print("-" * 80)
@@ -154,31 +274,33 @@ def list_faculty(csv_file: str, as_json: bool):
 
 
 @cli.command()
-@click.argument('csv_file', type=click.Path(exists=True))
+@click.argument('csv_file', type=CSV_PATH)
 @click.option('--json', 'as_json', is_flag=True, help='Output as JSON for programmatic use')
-def list_activities(csv_file: str, as_json: bool):
+def list_activities(csv_file: Path, as_json: bool):
     """List all activity types with data in the CSV file."""
-    import json as json_module
+    from . import parser
 
     if not as_json:
         print_info(f"Loading: {csv_file}")
 
-    data = parser.parse_csv(csv_file)
+    data = load_csv(csv_file)
     activity_types = parser.get_activity_types_with_data(data["activity_index"])
 
     if as_json:
-        output = []
-        for act in activity_types:
-            output.append({
+        print_json(
+            {
                 "key": act["key"],
                 "name": act["display_name"],
                 "category": act["category"],
                 "count": act["count"]
-            })
-        print(json_module.dumps(output, indent=2))
+            }
+            for act in activity_types
+        )
         return
 
     if RICH_AVAILABLE:
+        from rich.table import Table
+
         table = Table(title="Activity Types with Data")
         table.add_column("#", style="dim")
         table.add_column("Category")
@@ -193,54 +315,47 @@ def list_activities(csv_file: str, as_json: bool):
                 str(act["count"])
             )
 
-        console.print(table)
+        get_console().print(table)
     else:
         print("\nActivity Types:")
         print("-" * 60)
-        current_category = None
-        for i, act in enumerate(activity_types, 1):
-            if act["category"] != current_category:
-                current_category = act["category"]
-                print(f"\n{current_category}:")
-            print(f"  {i}. {act['display_name']} ({act['count']} entries)")
+        for category, numbered in group_by_category(activity_types):
+            print(f"\n{category}:")
+            for i, act in numbered:
+                print(f"  {i}. {act['display_name']} ({act['count']} entries)")
 
     print_info(f"\nTotal: {len(activity_types)} activity types with data")
 
 
 @cli.command()
-@click.argument('csv_file', type=click.Path(exists=True))
+@click.argument('csv_file', type=CSV_PATH)
 @click.option('--faculty', '-f', multiple=True, help='Faculty email or name to include (can specify multiple)')
 @click.option('--all', 'all_faculty', is_flag=True, help='Include all faculty')
 @click.option('--output', '-o', type=click.Path(), default='./reports', help='Output directory')
 @click.option('--combined', '-c', is_flag=True, help='Generate single combined document')
 @click.option('--format', '-F', 'formats', multiple=True, type=click.Choice(['md', 'pdf']),
               default=['md', 'pdf'], help='Output formats')
-def summary(csv_file: str, faculty: tuple, all_faculty: bool, output: str, combined: bool, formats: tuple):
+def summary(csv_file: Path, faculty: tuple, all_faculty: bool, output: str, combined: bool, formats: tuple):
     """Generate faculty summary reports."""
+    from . import parser, reports, pdf_generator
+
     print_info(f"Loading: {csv_file}")
 
-    data = parser.parse_csv(csv_file)
+    data = load_csv(csv_file)
     faculty_data = data["faculty"]
-    faculty_list = parser.get_faculty_list(faculty_data)
 
     # Determine which faculty to include
     if all_faculty:
-        selected = [f["email"] for f in faculty_list]
+        # Same order as get_faculty_list, without building the list
+        selected = sorted(faculty_data, key=lambda email: faculty_data[email]["display_name"].lower())
     elif faculty:
-        selected = []
-        for f in faculty:
-            # Try to match by email or name
-            f_lower = f.lower()
-            for fac in faculty_list:
-                if f_lower == fac["email"].lower() or f_lower in fac["display_name"].lower():
-                    selected.append(fac["email"])
-                    break
+        selected = select_faculty(faculty_data, faculty)
         if not selected:
             print_error(f"No faculty found matching: {faculty}")
             return
     else:
         # Interactive selection
-        selected = interactive_faculty_select(faculty_list)
+        selected = interactive_faculty_select(parser.get_faculty_list(faculty_data))
         if not selected:
             print_info("No faculty selected. Exiting.")
             return
@@ -258,41 +373,26 @@ def summary(csv_file: str, faculty: tuple, all_faculty: bool, output: str, combi
         for fmt, path in exported.items():
             print_success(f"Saved: {path}")
     else:
-        for email in selected:
-            fac = faculty_data.get(email)
-            if not fac:
-                continue
-            md_content = reports.generate_faculty_summary(fac)
-            filename = make_faculty_filename(fac["display_name"])
-            exported = pdf_generator.export_report(
-                md_content, output, filename, list(formats)
-            )
-            for fmt, path in exported.items():
-                print_success(f"Saved: {path}")
+        export_faculty_summaries(faculty_data, selected, output, list(formats))
 
 
 @cli.command()
-@click.argument('csv_file', type=click.Path(exists=True))
+@click.argument('csv_file', type=CSV_PATH)
 @click.option('--output', '-o', type=click.Path(), default='./reports/points_summary.csv', help='Output CSV file path')
 @click.option('--faculty', '-f', multiple=True, help='Faculty email or name to include (can specify multiple)')
 @click.option('--all', 'all_faculty', is_flag=True, default=True, help='Include all faculty (default)')
-def points(csv_file: str, output: str, faculty: tuple, all_faculty: bool):
+def points(csv_file: Path, output: str, faculty: tuple, all_faculty: bool):
     """Export faculty points summary as CSV, sorted alphabetically by surname."""
+    from . import reports
+
     print_info(f"Loading: {csv_file}")
 
-    data = parser.parse_csv(csv_file)
+    data = load_csv(csv_file)
     faculty_data = data["faculty"]
-    faculty_list = parser.get_faculty_list(faculty_data)
 
     # Determine which faculty to include
     if faculty:
-        selected = []
-        for f in faculty:
-            f_lower = f.lower()
-            for fac in faculty_list:
-                if f_lower == fac["email"].lower() or f_lower in fac["display_name"].lower():
-                    selected.append(fac["email"])
-                    break
+        selected = select_faculty(faculty_data, faculty)
         if not selected:
             print_error(f"No faculty found matching: {faculty}")
             return
@@ -300,18 +400,17 @@ def points(csv_file: str, output: str, faculty: tuple, all_faculty: bool):
         selected = None  # All faculty
 
     # Generate and save CSV
-    import os
-    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
     reports.save_points_summary_csv(faculty_data, output, selected)
     print_success(f"Saved: {output}")
 
     # Show summary
-    total_faculty = len(faculty_list) if not selected else len(selected)
+    total_faculty = len(faculty_data) if not selected else len(selected)
     print_info(f"Exported {total_faculty} faculty member(s)")
 
 
 @cli.command()
-@click.argument('csv_file', type=click.Path(exists=True))
+@click.argument('csv_file', type=CSV_PATH)
 @click.option('--types', '-t', multiple=True, help='Activity type keys to include (e.g., "content_expert.speaking")')
 @click.option('--all-types', 'all_types', is_flag=True, help='Include all activity types')
 @click.option('--output', '-o', type=click.Path(), default='./reports', help='Output directory')
@@ -319,11 +418,13 @@ def points(csv_file: str, output: str, faculty: tuple, all_faculty: bool):
               help='Sort order for entries')
 @click.option('--format', '-F', 'formats', multiple=True, type=click.Choice(['md', 'pdf']),
               default=['md', 'pdf'], help='Output formats')
-def activity(csv_file: str, types: tuple, all_types: bool, output: str, sort: str, formats: tuple):
+def activity(csv_file: Path, types: tuple, all_types: bool, output: str, sort: str, formats: tuple):
     """Generate activity-type reports."""
+    from . import parser, reports, pdf_generator
+
     print_info(f"Loading: {csv_file}")
 
-    data = parser.parse_csv(csv_file)
+    data = load_csv(csv_file)
     activity_index = data["activity_index"]
     activity_types = parser.get_activity_types_with_data(activity_index)
 
@@ -333,11 +434,11 @@ def activity(csv_file: str, types: tuple, all_types: bool, output: str, sort: st
     elif types:
         selected = list(types)
         # Validate
-        valid_keys = [a["key"] for a in activity_types]
+        valid_keys = {a["key"] for a in activity_types}
         for t in selected:
             if t not in valid_keys:
                 print_error(f"Unknown activity type: {t}")
-                print_info(f"Valid types: {', '.join(valid_keys)}")
+                print_info(f"Valid types: {', '.join(a['key'] for a in activity_types)}")
                 return
     else:
         # Interactive selection
@@ -370,13 +471,18 @@ def activity(csv_file: str, types: tuple, all_types: bool, output: str, sort: st
 
 
 @cli.command()
-@click.argument('csv_file', type=click.Path(exists=True))
+@click.argument('csv_file', type=CSV_PATH)
 @click.option('--output', '-o', type=click.Path(), default='./reports', help='Output directory')
-def interactive(csv_file: str, output: str):
+def interactive(csv_file: Path, output: str):
     """Interactive mode for selecting and exporting reports."""
+    from . import parser, reports, pdf_generator
+    if RICH_AVAILABLE:
+        from rich.panel import Panel
+        from rich.prompt import Prompt, Confirm
+
     print_info(f"Loading: {csv_file}")
 
-    data = parser.parse_csv(csv_file)
+    data = load_csv(csv_file)
     faculty_data = data["faculty"]
     activity_index = data["activity_index"]
 
@@ -390,7 +496,7 @@ def interactive(csv_file: str, output: str):
             f"[bold]Total Points:[/bold] {summary['grand_totals']['total']:,}",
             title="Data Summary"
         )
-        console.print(panel)
+        get_console().print(panel)
     else:
         print(f"\nData Summary:")
         print(f"  Faculty: {summary['total_faculty']} ({summary['complete_submissions']} complete, {summary['incomplete_submissions']} incomplete)")
@@ -423,14 +529,7 @@ def interactive(csv_file: str, output: str):
                     md_content = summaries["combined"]
                     exported = pdf_generator.export_report(md_content, output, f"Faculty_Combined_AVC_{academic_year}_Summary")
                 else:
-                    for email in selected:
-                        fac = faculty_data.get(email)
-                        if fac:
-                            md_content = reports.generate_faculty_summary(fac)
-                            filename = make_faculty_filename(fac["display_name"])
-                            exported = pdf_generator.export_report(md_content, output, filename)
-                            for fmt, path in exported.items():
-                                print_success(f"Saved: {path}")
+                    export_faculty_summaries(faculty_data, selected, output)
 
         elif choice == "2":
             activity_types = parser.get_activity_types_with_data(activity_index)
@@ -455,8 +554,99 @@ def interactive(csv_file: str, output: str):
             break
 
 
+def _export_faculty_summary(fac: dict, output: str, formats: Optional[List[str]],
+                            academic_year: Optional[str] = None) -> dict:
+    """Render and export one faculty summary (module-level so worker processes can run it)."""
+    from . import reports, pdf_generator
+
+    md_content = reports.generate_faculty_summary(fac)
+    filename = make_faculty_filename(fac["display_name"], academic_year=academic_year)
+    return pdf_generator.export_report(md_content, output, filename, formats)
+
+
+def export_faculty_summaries(faculty_data: dict, selected: List[str], output: str,
+                             formats: Optional[List[str]] = None):
+    """
+    Export an individual summary file per selected faculty member.
+
+    PDF rendering is CPU-bound and each report is independent, so larger
+    batches are spread across worker processes; results are reported in
+    selection order either way.
+    """
+    records = [faculty_data[email] for email in selected if email in faculty_data]
+    wants_pdf = formats is None or "pdf" in formats
+    # Resolved here so every file in the batch is named for the same year
+    academic_year = get_academic_year()
+
+    if len(records) > 2 and wants_pdf:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(
+                _export_faculty_summary, records, [output] * len(records),
+                [formats] * len(records), [academic_year] * len(records)
+            ))
+    else:
+        results = [_export_faculty_summary(fac, output, formats, academic_year) for fac in records]
+
+    for exported in results:
+        for fmt, path in exported.items():
+            print_success(f"Saved: {path}")
+
+
+# Above this many rows the selectors skip rich's layout engine on each redraw
+FAST_TABLE_THRESHOLD = 50
+
+
+def _prealigned_table(headers, rows, right_align=()):
+    """
+    Pre-align a selection table once and return render(selected) -> str.
+
+    rows are (key, cells) pairs of plain strings; a "Sel" column is drawn
+    after the first cell. Column widths are measured up front, so each
+    redraw is just string joins.
+    """
+    widths = [max(len(header), *(len(cells[i]) for _, cells in rows)) for i, header in enumerate(headers)]
+
+    def align(cells):
+        return [
+            cell.rjust(width) if i in right_align else cell.ljust(width)
+            for i, (cell, width) in enumerate(zip(cells, widths))
+        ]
+
+    head = align(headers)
+    header_line = "  ".join([head[0], "Sel"] + head[1:]).rstrip()
+    lines = [(key, cells[0], "  ".join(cells[1:]).rstrip()) for key, cells in ((key, align(cells)) for key, cells in rows)]
+    mark = "\x1b[32m ✓ \x1b[0m" if sys.stdout.isatty() else " ✓ "
+
+    def render(selected):
+        out = [header_line]
+        for key, first, rest in lines:
+            out.append(f"{first}  {mark if key in selected else '   '}  {rest}")
+        return "\n".join(out) + "\n"
+
+    return render
+
+
+def group_by_category(activity_types: List[dict]) -> List[tuple]:
+    """
+    Split the (category-sorted) activity list into runs for display.
+
+    Returns [(category, [(number, activity), ...]), ...] with 1-based
+    numbers running across groups, matching the selection prompt.
+    """
+    return [
+        (category, list(numbered))
+        for category, numbered in groupby(enumerate(activity_types, 1), key=lambda item: item[1]["category"])
+    ]
+
+
 def interactive_faculty_select(faculty_list: List[dict]) -> List[str]:
     """Interactive faculty selection with checkboxes."""
+    if RICH_AVAILABLE:
+        from rich.table import Table
+        from rich.prompt import Prompt
+
     if not faculty_list:
         print_error("No faculty found in data.")
         return []
@@ -465,11 +655,27 @@ def interactive_faculty_select(faculty_list: List[dict]) -> List[str]:
     print_info("Faculty Selection")
     print("Enter numbers to toggle selection, 'a' for all, 'd' for none, 'done' when finished.\n")
 
-    # Show list
-    selected = set()
+    # Show list; a dict serves as an insertion-ordered set so the result
+    # follows the order faculty were picked in
+    selected = {}
+
+    # Everything but the selection mark is fixed; format it once, not per redraw
+    if RICH_AVAILABLE:
+        rows = [
+            (fac["email"], (str(i), fac["display_name"], f"{fac['total_points']:,}",
+                            "INC" if fac["has_incomplete"] else ""))
+            for i, fac in enumerate(faculty_list, 1)
+        ]
+        if len(rows) > FAST_TABLE_THRESHOLD:
+            render_fast = _prealigned_table(("#", "Name", "Points", "Status"), rows, right_align={0, 2})
 
     while True:
-        if RICH_AVAILABLE:
+        if RICH_AVAILABLE and len(rows) > FAST_TABLE_THRESHOLD:
+            sys.stdout.write(render_fast(selected))
+            choice = Prompt.ask(
+                f"\n[cyan]Selected: {len(selected)}[/cyan] Enter #, 'a'=all, 'd'=none, 'done'=finish"
+            )
+        elif RICH_AVAILABLE:
             table = Table(show_header=True)
             table.add_column("#", style="dim", width=4)
             table.add_column("Sel", width=3)
@@ -477,12 +683,11 @@ def interactive_faculty_select(faculty_list: List[dict]) -> List[str]:
             table.add_column("Points", justify="right")
             table.add_column("Status")
 
-            for i, fac in enumerate(faculty_list, 1):
-                sel = "[green]✓[/green]" if fac["email"] in selected else " "
-                status = "[yellow]INC[/yellow]" if fac["has_incomplete"] else ""
-                table.add_row(str(i), sel, fac["display_name"], f"{fac['total_points']:,}", status)
+            for email, (num, name, pts, status) in rows:
+                sel = "[green]✓[/green]" if email in selected else " "
+                table.add_row(num, sel, name, pts, f"[yellow]{status}[/yellow]" if status else "")
 
-            console.print(table)
+            get_console().print(table)
             choice = Prompt.ask(
                 f"\n[cyan]Selected: {len(selected)}[/cyan] Enter #, 'a'=all, 'd'=none, 'done'=finish"
             )
@@ -498,9 +703,9 @@ def interactive_faculty_select(faculty_list: List[dict]) -> List[str]:
         if choice == 'done' or choice == '':
             break
         elif choice == 'a':
-            selected = {f["email"] for f in faculty_list}
+            selected = dict.fromkeys(f["email"] for f in faculty_list)
         elif choice == 'd':
-            selected = set()
+            selected = {}
         else:
             # Parse numbers (can be comma-separated or range like 1-5)
             try:
@@ -508,9 +713,9 @@ def interactive_faculty_select(faculty_list: List[dict]) -> List[str]:
                 for n in nums:
                     email = faculty_list[n - 1]["email"]
                     if email in selected:
-                        selected.discard(email)
+                        del selected[email]
                     else:
-                        selected.add(email)
+                        selected[email] = None
             except (ValueError, IndexError):
                 print_error("Invalid input. Enter a number, range (1-5), or comma-separated (1,3,5)")
 
@@ -519,6 +724,10 @@ def interactive_faculty_select(faculty_list: List[dict]) -> List[str]:
 
 def interactive_activity_select(activity_types: List[dict]) -> List[str]:
     """Interactive activity type selection with checkboxes."""
+    if RICH_AVAILABLE:
+        from rich.table import Table
+        from rich.prompt import Prompt
+
     if not activity_types:
         print_error("No activity types with data found.")
         return []
@@ -527,10 +736,27 @@ def interactive_activity_select(activity_types: List[dict]) -> List[str]:
     print_info("Activity Type Selection")
     print("Enter numbers to toggle selection, 'a' for all, 'd' for none, 'done' when finished.\n")
 
-    selected = set()
+    # Insertion-ordered set (see interactive_faculty_select)
+    selected = {}
+
+    # Everything but the selection mark is fixed; format it once, not per redraw
+    if RICH_AVAILABLE:
+        rows = [
+            (act["key"], (str(i), act["category"], act["display_name"], str(act["count"])))
+            for i, act in enumerate(activity_types, 1)
+        ]
+        if len(rows) > FAST_TABLE_THRESHOLD:
+            render_fast = _prealigned_table(("#", "Category", "Activity Type", "Count"), rows, right_align={0, 3})
+    else:
+        grouped = group_by_category(activity_types)
 
     while True:
-        if RICH_AVAILABLE:
+        if RICH_AVAILABLE and len(rows) > FAST_TABLE_THRESHOLD:
+            sys.stdout.write(render_fast(selected))
+            choice = Prompt.ask(
+                f"\n[cyan]Selected: {len(selected)}[/cyan] Enter #, 'a'=all, 'd'=none, 'done'=finish"
+            )
+        elif RICH_AVAILABLE:
             table = Table(show_header=True)
             table.add_column("#", style="dim", width=4)
             table.add_column("Sel", width=3)
@@ -538,22 +764,20 @@ def interactive_activity_select(activity_types: List[dict]) -> List[str]:
             table.add_column("Activity Type")
             table.add_column("Count", justify="right")
 
-            for i, act in enumerate(activity_types, 1):
-                sel = "[green]✓[/green]" if act["key"] in selected else " "
-                table.add_row(str(i), sel, act["category"], act["display_name"], str(act["count"]))
+            for key, (num, category, name, count) in rows:
+                sel = "[green]✓[/green]" if key in selected else " "
+                table.add_row(num, sel, category, name, count)
 
-            console.print(table)
+            get_console().print(table)
             choice = Prompt.ask(
                 f"\n[cyan]Selected: {len(selected)}[/cyan] Enter #, 'a'=all, 'd'=none, 'done'=finish"
             )
         else:
-            current_category = None
-            for i, act in enumerate(activity_types, 1):
-                if act["category"] != current_category:
-                    current_category = act["category"]
-                    print(f"\n{current_category}:")
-                sel = "✓" if act["key"] in selected else " "
-                print(f"  [{sel}] {i}. {act['display_name']} ({act['count']})")
+            for category, numbered in grouped:
+                print(f"\n{category}:")
+                for i, act in numbered:
+                    sel = "✓" if act["key"] in selected else " "
+                    print(f"  [{sel}] {i}. {act['display_name']} ({act['count']})")
 
             print(f"\nSelected: {len(selected)}")
             choice = input("Enter #, 'a'=all, 'd'=none, 'done'=finish: ").strip().lower()
@@ -561,42 +785,47 @@ def interactive_activity_select(activity_types: List[dict]) -> List[str]:
         if choice == 'done' or choice == '':
             break
         elif choice == 'a':
-            selected = {a["key"] for a in activity_types}
+            selected = dict.fromkeys(a["key"] for a in activity_types)
         elif choice == 'd':
-            selected = set()
+            selected = {}
         else:
             try:
                 nums = parse_number_input(choice, len(activity_types))
                 for n in nums:
                     key = activity_types[n - 1]["key"]
                     if key in selected:
-                        selected.discard(key)
+                        del selected[key]
                     else:
-                        selected.add(key)
+                        selected[key] = None
             except (ValueError, IndexError):
                 print_error("Invalid input. Enter a number, range (1-5), or comma-separated (1,3,5)")
 
     return list(selected)
 
 
+# One selection item: "3" or "2-5", optionally followed by a comma
+_NUMBER_ITEM = re.compile(r'\s*(\d+)\s*(?:-\s*(\d+))?\s*(?:,|$)')
+
+
 def parse_number_input(input_str: str, max_val: int) -> List[int]:
     """Parse number input that can be single, comma-separated, or range."""
     nums = []
-
-    for part in input_str.split(','):
-        part = part.strip()
-        if '-' in part:
-            start, end = part.split('-')
-            start, end = int(start.strip()), int(end.strip())
-            if start < 1 or end > max_val:
-                raise ValueError("Out of range")
-            nums.extend(range(start, end + 1))
-        else:
-            n = int(part)
-            if n < 1 or n > max_val:
-                raise ValueError("Out of range")
-            nums.append(n)
-
+    pos = 0
+    end = len(input_str)
+
+    while pos < end:
+        match = _NUMBER_ITEM.match(input_str, pos)
+        if not match or match.end() == pos:
+            raise ValueError("Invalid input")
+        start = int(match.group(1))
+        stop = int(match.group(2)) if match.group(2) else start
+        if start < 1 or stop > max_val or start > stop:
+            raise ValueError("Out of range")
+        nums.extend(range(start, stop + 1))
+        pos = match.end()
+
+    if not nums:
+        raise ValueError("Invalid input")
     return nums
 
 
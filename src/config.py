@@ -8,13 +8,15 @@ This module defines:
 - Field mappings from labeled CSV headers to internal names
 """
 
-from typing import Dict, List, Any
+import functools
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
 # =============================================================================
 # ACTIVITY CATEGORIES
 # =============================================================================
 
-ACTIVITY_CATEGORIES = {
+ACTIVITY_CATEGORIES = MappingProxyType({
     "citizenship": {
         "name": "Citizenship",
         "subcategories": ["evaluations", "committees", "department_activities"]
@@ -36,13 +38,14 @@ ACTIVITY_CATEGORIES = {
         "subcategories": ["speaking", "publications_peer", "publications_nonpeer",
                          "pathways", "textbooks", "abstracts", "journal_editorial"]
     }
-}
+})
 
 # =============================================================================
 # POINT VALUES (from data dictionary val_* fields)
 # =============================================================================
 
-POINT_VALUES = {
+# Read-only: shared by every parse, so accidental writes would leak between runs
+POINT_VALUES = MappingProxyType({
     # Citizenship
     "eval_80_completion": 2000,
     "committee_unmc": 1000,
@@ -160,12 +163,16 @@ POINT_VALUES = {
     "journal_special_edition": 10000,
     "journal_editorial_board": 5000,
     "journal_adhoc_reviewer": 1000,
-}
+})
 
 # =============================================================================
 # CSV COLUMN MAPPINGS (Labeled Headers -> Internal Names)
 # =============================================================================
 
+# Choice offered on every repeating section for respondents who clicked Yes
+# by mistake; each type mapping sends it to None so the entry is skipped
+MISTAKE_SENTINEL = "I mistakenly answered Yes - I did not do this activity"
+
 # Core identity columns
 IDENTITY_COLUMNS = {
     "Record ID": "record_id",
@@ -177,33 +184,33 @@ IDENTITY_COLUMNS = {
 }
 
 # Committee type mappings (from radio button choices)
-COMMITTEE_TYPES = {
+COMMITTEE_TYPES = MappingProxyType({
     "UNMC standing committee (admissions, GME, curriculum, senate, IRB)": "unmc",
     "Nebraska Medicine standing committee (MEC/med staff)": "nebmed",
     "Minor or ad hoc committee": "minor",
-    "I mistakenly answered Yes - I did not do this activity": None,
-}
+    MISTAKE_SENTINEL: None,
+})
 
 # Department activity type mappings
-DEPARTMENT_ACTIVITY_TYPES = {
+DEPARTMENT_ACTIVITY_TYPES = MappingProxyType({
     "Grand Rounds Host": "grand_rounds_host",
     "Grand Rounds Attendance (in person)": "grand_rounds_attend",
     "Journal Club Host": "journal_club_host",
     "Journal Club Attendance": "journal_club_attend",
     "Student Shadowing Mentor": "student_shadow",
-    "I mistakenly answered Yes - I did not do this activity": None,
-}
+    MISTAKE_SENTINEL: None,
+})
 
 # Teaching recognition mappings
-TEACHING_RECOGNITION = {
+TEACHING_RECOGNITION = MappingProxyType({
     "Teacher of the Year": "teacher_of_year",
     "Teacher of the Year - Honorable Mention": "teacher_of_year_honorable",
     "Top 25% Teaching Evaluations": "teaching_top25",
     "25-65% Teaching Evaluations": "teaching_25_65",
-}
+})
 
 # Lecture type mappings
-LECTURE_TYPES = {
+LECTURE_TYPES = MappingProxyType({
     "New Lecture": "lecture_new",
     "Revised Existing Lecture": "lecture_revised",
     "Existing Lecture (no revision)": "lecture_existing",
@@ -213,97 +220,97 @@ LECTURE_TYPES = {
     "Core COM Faculty - Revised Lecture": "com_core_revised",
     "Ad Hoc COM Faculty - New Lecture": "com_adhoc_new",
     "Ad Hoc COM Faculty - Revised Lecture": "com_adhoc_revised",
-    "I mistakenly answered Yes - I did not do this activity": None,
-}
+    MISTAKE_SENTINEL: None,
+})
 
 # Board prep type mappings
-BOARD_PREP_TYPES = {
+BOARD_PREP_TYPES = MappingProxyType({
     "Mock Applied Exam Faculty": "mock_applied_exam",
     "New OSCE Preparation": "osce_new",
     "OSCE Reviewer (per 5 videos)": "osce_reviewer",
     "Mock Oral Examiner (per session)": "mock_oral_examiner",
-    "I mistakenly answered Yes - I did not do this activity": None,
-}
+    MISTAKE_SENTINEL: None,
+})
 
 # Mentorship type mappings
-MENTORSHIP_TYPES = {
+MENTORSHIP_TYPES = MappingProxyType({
     "Poster presentation (MARC/ASA/SCA/other)": "poster",
     "Research abstract mentorship": "abstract",
     "Presentation mentoring": "presentation",
     "Publication mentoring": "publication",
     "Resident Advisor": "resident_advisor",
-    "I mistakenly answered Yes - I did not do this activity": None,
-}
+    MISTAKE_SENTINEL: None,
+})
 
 # Grant review type mappings
-GRANT_REVIEW_TYPES = {
+GRANT_REVIEW_TYPES = MappingProxyType({
     "NIH Study Section - Standing": "nih_standing",
     "NIH Study Section - Ad Hoc": "nih_adhoc",
-}
+})
 
 # Grant award level mappings
-GRANT_AWARD_LEVELS = {
+GRANT_AWARD_LEVELS = MappingProxyType({
     "Grant ≥ $100,000": "grant_100k_plus",
     "Grant $50,000-99,999": "grant_50_99k",
     "Direct costs $10,000-49,999": "grant_10_49k",
     "Direct costs < $10,000": "grant_under_10k",
-}
+})
 
 # Grant submission type mappings
-GRANT_SUBMISSION_TYPES = {
+GRANT_SUBMISSION_TYPES = MappingProxyType({
     "Scored submission": "scored",
     "Not scored submission": "not_scored",
     "Mentor on submission": "mentor",
-}
+})
 
 # Education leadership role mappings
-EDUCATION_LEADERSHIP_TYPES = {
+EDUCATION_LEADERSHIP_TYPES = MappingProxyType({
     "Course Director (national/international)": "course_director_national",
     "Workshop Director": "workshop_director",
     "Panel Moderator": "panel_moderator",
     "UNMC Course Director": "unmc_course_director",
     "UNMC Moderator": "unmc_moderator",
     "Guideline Writing Lead": "guideline_writing_lead",
-    "I mistakenly answered Yes - I did not do this activity": None,
-}
+    MISTAKE_SENTINEL: None,
+})
 
 # Society leadership role mappings
-SOCIETY_LEADERSHIP_TYPES = {
+SOCIETY_LEADERSHIP_TYPES = MappingProxyType({
     "Society BOD Member": "society_bod",
     "Society RRC Member": "society_rrc",
     "Major Board Committee Chair": "society_committee_chair",
     "Major Board Committee Member": "society_committee_member",
-    "I mistakenly answered Yes - I did not do this activity": None,
-}
+    MISTAKE_SENTINEL: None,
+})
 
 # Board leadership role mappings
-BOARD_LEADERSHIP_TYPES = {
+BOARD_LEADERSHIP_TYPES = MappingProxyType({
     "Boards Editor": "boards_editor",
     "Writing Committee Chair": "writing_committee_chair",
     "Board Examiner": "board_examiner",
     "Question Writer": "question_writer",
-    "I mistakenly answered Yes - I did not do this activity": None,
-}
+    MISTAKE_SENTINEL: None,
+})
 
 # Speaking type mappings
-SPEAKING_TYPES = {
+SPEAKING_TYPES = MappingProxyType({
     "International/National Lecture": "lecture_national_international",
     "Regional/UNMC Lecture": "lecture_regional_unmc",
     "National Workshop": "workshop_national",
     "Regional/UNMC Workshop": "workshop_regional",
     "Visiting Professor Grand Rounds": "visiting_prof_grand_rounds",
     "Non-Anesthesiology UNMC Grand Rounds": "non_anes_unmc_grand_rounds",
-    "I mistakenly answered Yes - I did not do this activity": None,
-}
+    MISTAKE_SENTINEL: None,
+})
 
 # Publication role mappings
-PUBLICATION_ROLES = {
+PUBLICATION_ROLES = MappingProxyType({
     "First or Senior Author": "first_senior",
     "Co-author": "coauth",
-}
+})
 
 # Textbook role mappings
-TEXTBOOK_ROLES = {
+TEXTBOOK_ROLES = MappingProxyType({
     "Textbook Senior Editor (Major)": "senior_editor_major",
     "Textbook Senior Editor (Minor)": "senior_editor_minor",
     "Textbook Section Editor (Major)": "section_editor_major",
@@ -312,33 +319,33 @@ TEXTBOOK_ROLES = {
     "Chapter First/Senior Author (Minor)": "chapter_first_minor",
     "Chapter Co-author (Major)": "chapter_coauth_major",
     "Chapter Co-author (Minor)": "chapter_coauth_minor",
-    "I mistakenly answered Yes - I did not do this activity": None,
-}
+    MISTAKE_SENTINEL: None,
+})
 
 # Abstract role mappings
-ABSTRACT_ROLES = {
+ABSTRACT_ROLES = MappingProxyType({
     "First or Senior Author": "first_senior",
     "2nd Author with Trainee as 1st": "second_trainee_first",
     "Co-author": "coauth",
-    "I mistakenly answered Yes - I did not do this activity": None,
-}
+    MISTAKE_SENTINEL: None,
+})
 
 # Pathway activity mappings
-PATHWAY_TYPES = {
+PATHWAY_TYPES = MappingProxyType({
     "New Clinical Pathway": "pathway_new",
     "Revised Clinical Pathway": "pathway_revised",
-    "I mistakenly answered Yes - I did not do this activity": None,
-}
+    MISTAKE_SENTINEL: None,
+})
 
 # Journal editorial role mappings
-JOURNAL_EDITORIAL_TYPES = {
+JOURNAL_EDITORIAL_TYPES = MappingProxyType({
     "Journal Editor-in-Chief": "editor_chief",
     "Journal Section Editor": "section_editor",
     "Journal Special Edition Editor": "special_edition",
     "Editorial Board Member": "editorial_board",
     "Ad Hoc Reviewer (4+ reviews/year for same journal)": "adhoc_reviewer",
-    "I mistakenly answered Yes - I did not do this activity": None,
-}
+    MISTAKE_SENTINEL: None,
+})
 
 # =============================================================================
 # REPEATING FIELD PATTERNS
@@ -577,7 +584,7 @@ SUBTOTAL_COLUMNS = {
 # ACTIVITY TYPE DISPLAY NAMES (for reports)
 # =============================================================================
 
-ACTIVITY_DISPLAY_NAMES = {
+ACTIVITY_DISPLAY_NAMES = MappingProxyType({
     # Citizenship
     "evaluations": "Trainee Evaluation Completion (≥80%)",
     "committees": "Committee Membership",
@@ -610,15 +617,52 @@ ACTIVITY_DISPLAY_NAMES = {
     "textbooks": "Textbook Contributions",
     "abstracts": "Research Abstracts",
     "journal_editorial": "Journal Editorial Roles",
-}
+})
+
 
+@functools.lru_cache(maxsize=1)
+def get_activity_type_choices() -> Mapping[str, Tuple[Tuple[str, str], ...]]:
+    """
+    Return all activity types grouped by category for selection UI.
 
-def get_activity_type_choices() -> Dict[str, List[str]]:
-    """Return all activity types grouped by category for selection UI."""
-    choices = {}
-    for category, info in ACTIVITY_CATEGORIES.items():
-        choices[info["name"]] = [
+    Built from module constants, so it is computed once and shared; the
+    result is read-only.
+    """
+    return MappingProxyType({
+        info["name"]: tuple(
             (subcat, ACTIVITY_DISPLAY_NAMES.get(subcat, subcat))
             for subcat in info["subcategories"]
-        ]
-    return choices
+        )
+        for info in ACTIVITY_CATEGORIES.values()
+    })
+
+
+def _check_schema() -> None:
+    """
+    Cross-check the tables above so a typo fails at import, not as a silently
+    empty section in a report.
+    """
+    subcategories = {
+        subcat
+        for info in ACTIVITY_CATEGORIES.values()
+        for subcat in info["subcategories"]
+    }
+    problems = []
+
+    for subcat in sorted(subcategories - set(ACTIVITY_DISPLAY_NAMES)):
+        problems.append(f"subcategory {subcat!r} has no display name")
+    for subcat in sorted(set(REPEATING_FIELD_PATTERNS) - subcategories):
+        problems.append(f"REPEATING_FIELD_PATTERNS section {subcat!r} is not a subcategory")
+    for subcat in sorted(set(SUBTOTAL_COLUMNS.values()) - subcategories):
+        problems.append(f"SUBTOTAL_COLUMNS target {subcat!r} is not a subcategory")
+    for section, spec in REPEATING_FIELD_PATTERNS.items():
+        if spec["type_column"] not in spec["fields"].values():
+            problems.append(f"{section}: type_column is not one of its fields")
+        if "{n}" not in spec["fields"].get("points", ""):
+            problems.append(f"{section}: points column has no {{n}} placeholder")
+
+    if problems:
+        raise ImportError("Invalid activity schema in config: " + "; ".join(problems))
+
+
+_check_schema()
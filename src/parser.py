@@ -12,20 +12,88 @@ Key features:
 """
 
 import csv
+import functools
+import hashlib
+import io
+import os
+import pickle
 import re
+import tempfile
 from io import StringIO
-from typing import Dict, List, Any, Optional, Union, IO
+from typing import Dict, List, Any, Iterator, Optional, Union, IO
 from collections import defaultdict
 
 from . import config
 
+# dict.get default that tells "not in the mapping" apart from a None mapping
+# (None marks an "I mistakenly answered Yes" choice)
+_UNMAPPED = object()
+
+
+@functools.lru_cache(maxsize=4096)
+def canonicalize_label(text: str) -> str:
+    """Collapse whitespace and casefold so choice label variants compare equal."""
+    return " ".join(text.split()).casefold()
+
+
+def _canonical_table(table) -> Dict[str, Any]:
+    """A choice table re-keyed by canonical label."""
+    return {canonicalize_label(label): value for label, value in table.items()}
+
+
+# Canonical forms of the config choice tables, built once at import. Each
+# entry holds the table itself, so the id() key stays tied to that object.
+_CANONICAL_TABLES: Dict[int, tuple] = {
+    id(table): (table, _canonical_table(table))
+    for table in (
+        config.COMMITTEE_TYPES,
+        config.DEPARTMENT_ACTIVITY_TYPES,
+        config.TEACHING_RECOGNITION,
+        config.LECTURE_TYPES,
+        config.BOARD_PREP_TYPES,
+        config.MENTORSHIP_TYPES,
+        config.GRANT_REVIEW_TYPES,
+        config.GRANT_AWARD_LEVELS,
+        config.GRANT_SUBMISSION_TYPES,
+        config.EDUCATION_LEADERSHIP_TYPES,
+        config.SOCIETY_LEADERSHIP_TYPES,
+        config.BOARD_LEADERSHIP_TYPES,
+        config.SPEAKING_TYPES,
+        config.PUBLICATION_ROLES,
+        config.TEXTBOOK_ROLES,
+        config.ABSTRACT_ROLES,
+        config.PATHWAY_TYPES,
+        config.JOURNAL_EDITORIAL_TYPES,
+    )
+}
+
+
+def lookup_choice(table, text: str, default: Any = None) -> Any:
+    """
+    Map a survey choice label through a config type table.
+
+    Exact labels hit the table directly; anything else is retried against the
+    canonical (whitespace/case-insensitive) form of the table's labels. Other
+    mappings work too, but their canonical form is rebuilt on every miss.
+    """
+    value = table.get(text, _UNMAPPED)
+    if value is not _UNMAPPED:
+        return value
+
+    entry = _CANONICAL_TABLES.get(id(table))
+    if entry is not None and entry[0] is table:
+        canonical = entry[1]
+    else:
+        canonical = _canonical_table(table)
+    return canonical.get(canonicalize_label(text), default)
+
 
-def parse_csv(file_input: Union[str, IO]) -> Dict[str, Any]:
+def parse_csv(file_input: Union[str, os.PathLike, IO]) -> Dict[str, Any]:
     """
     Parse a REDCap CSV export and return aggregated faculty data.
 
     Args:
-        file_input: Either a file path string or a file-like object
+        file_input: Either a file path (str or Path) or a file-like object
 
     Returns:
         Dictionary with:
@@ -33,38 +101,33 @@ def parse_csv(file_input: Union[str, IO]) -> Dict[str, Any]:
         - activity_index: Dict of activities by type (for activity-type reports)
         - summary: Overall statistics
     """
-    # Read CSV content
-    if isinstance(file_input, str):
+    # Rows are streamed into the parser rather than buffering the export
+    if isinstance(file_input, (str, os.PathLike)):
         with open(file_input, 'r', encoding='utf-8-sig') as f:
-            content = f.read()
+            submissions = _parse_rows(csv.reader(f))
+    elif isinstance(file_input, io.TextIOBase):
+        submissions = _parse_rows(csv.reader(file_input))
+    elif isinstance(file_input, (io.BufferedIOBase, io.RawIOBase)):
+        # Decode on the fly; detach so the caller's stream is left open
+        text = io.TextIOWrapper(file_input, encoding='utf-8-sig', newline='')
+        try:
+            submissions = _parse_rows(csv.reader(text))
+        finally:
+            text.detach()
     else:
+        # Other objects with read() (may yield str or bytes)
         content = file_input.read()
         if isinstance(content, bytes):
             content = content.decode('utf-8-sig')
+        submissions = _parse_rows(csv.reader(StringIO(content)))
+        del content  # Don't hold the raw export while aggregating
 
-    # Parse CSV using raw reader (not DictReader) to handle duplicate columns
-    reader = csv.reader(StringIO(content))
-    rows = list(reader)
-
-    if not rows:
+    if submissions is None:
         return {"faculty": {}, "activity_index": {}, "summary": {}}
 
-    # First row is headers
-    headers = rows[0]
-    data_rows = rows[1:]
-
-    # Build column index map (header -> list of column indices)
-    col_index = build_column_index(headers)
-
-    # Parse each row into structured data
-    submissions = []
-    for row in data_rows:
-        parsed = parse_row_indexed(row, headers, col_index)
-        if parsed:  # Skip empty/invalid rows
-            submissions.append(parsed)
-
-    # Aggregate by faculty member
+    # Aggregate by faculty member; per-row records aren't needed after this
     faculty_data = aggregate_by_faculty(submissions)
+    del submissions
 
     # Build activity index for activity-type reports
     activity_index = build_activity_index(faculty_data)
@@ -79,12 +142,132 @@ def parse_csv(file_input: Union[str, IO]) -> Dict[str, Any]:
     }
 
 
+def _parse_rows(reader: Iterator[List[str]]) -> Optional[List[Dict[str, Any]]]:
+    """Parse csv.reader rows into submissions; None if there is no header row."""
+    # Raw reader (not DictReader) to handle duplicate columns
+    headers = next(reader, None)
+    if headers is None:
+        return None
+
+    # Build column index map (header -> list of column indices)
+    col_index = build_column_index(headers)
+
+    # Parse each row into structured data
+    submissions = []
+    for row in reader:
+        if not any(row):
+            continue  # Blank line or all-empty padding row
+        parsed = parse_row_indexed(row, col_index)
+        if parsed:  # Skip empty/invalid rows
+            submissions.append(parsed)
+    return submissions
+
+
+def default_cache_dir() -> str:
+    """Directory for parse_csv_cached results (honours XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "aaa-summarizer")
+
+
+def parse_csv_cached(path: Union[str, os.PathLike], cache_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    parse_csv for a file path, reusing a pickled result from an earlier run.
+
+    The cache key covers the CSV's path, size and mtime plus the parser and
+    config modules' mtimes, so editing either the export or the parsing
+    rules forces a fresh parse. Only the newest pickle is kept per CSV path:
+    writing one removes the stale entries for that path. Cache read/write
+    failures fall back to parsing normally.
+    """
+    cache_dir = cache_dir or default_cache_dir()
+    try:
+        abspath = os.path.abspath(path)
+        st = os.stat(path)
+        key = "|".join(str(part) for part in (
+            abspath, st.st_size, st.st_mtime_ns,
+            os.stat(__file__).st_mtime_ns, os.stat(config.__file__).st_mtime_ns,
+        ))
+    except OSError:
+        return parse_csv(path)
+
+    # <path hash>-<key hash>.pickle, so a path's older entries can be found
+    path_prefix = hashlib.sha256(abspath.encode()).hexdigest()[:16] + "-"
+    cache_name = path_prefix + hashlib.sha256(key.encode()).hexdigest() + ".pickle"
+    cache_path = os.path.join(cache_dir, cache_name)
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        pass
+
+    data = parse_csv(path)
+
+    # Write to a temp file and rename so concurrent runs never see a partial pickle
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        # The new entry supersedes any earlier parse of the same file; names
+        # without a path prefix come from before entries were pruned
+        for name in os.listdir(cache_dir):
+            if not name.endswith(".pickle") or name == cache_name:
+                continue
+            if name.startswith(path_prefix) or "-" not in name:
+                try:
+                    os.unlink(os.path.join(cache_dir, name))
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+    return data
+
+
+def parse_int(value: str, default: int = 0) -> int:
+    """
+    Integer value of a REDCap number cell ("3", "250.0", "1e3"), truncated
+    toward zero; default for blanks and anything that isn't a finite number.
+    """
+    if not value:
+        return default
+    try:
+        return int(value)  # Common case, no float round-trip
+    except ValueError:
+        pass
+    try:
+        return int(float(value))
+    except (ValueError, OverflowError):
+        return default
+
+
+class ColumnIndex(dict):
+    """
+    Column name -> list of column indices, plus the header row and the
+    section plans resolved against it (see section_plan), so each repeating
+    section is resolved once per file rather than once per row.
+    """
+
+    __slots__ = ("headers", "section_plans")
+
+    def __init__(self, *args, headers: Optional[List[str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.headers = headers
+        self.section_plans = {}
+
+
 def build_column_index(headers: List[str]) -> Dict[str, List[int]]:
     """Build a map of column name -> list of column indices for duplicate handling."""
-    col_index = defaultdict(list)
+    col_index = ColumnIndex(headers=headers)
     for i, header in enumerate(headers):
-        col_index[header].append(i)
-    return dict(col_index)
+        col_index.setdefault(header, []).append(i)
+    return col_index
 
 
 def get_col_value(row: List[str], col_index: Dict[str, List[int]], col_name: str, occurrence: int = 0) -> str:
@@ -97,67 +280,184 @@ def get_col_value(row: List[str], col_index: Dict[str, List[int]], col_name: str
     return ""
 
 
+# Map field names to report-friendly keys
+_FIELD_KEYS = {
+    "Committee name": "name",
+    "Your role (member, chair, etc.)": "role",
+    "Date of activity": "date",
+    "Name of Visiting Professor, Shadow Student, or Topic": "name",
+    "Lecture title": "title",
+    "Date delivered": "date",
+    "Board prep activity type": "type",
+    "Location": "location",
+    "Trainee name": "trainee",
+    "Title of poster/abstract/presentation/publication": "title",
+    "Meeting/journal name": "meeting",
+    "Date": "date",
+    "Award level": "level",
+    "Grant title": "title",
+    "PI name (if not you)": "pi",
+    "Funding agency": "agency",
+    "Submission type/outcome": "type",
+    "Agency": "agency",
+    "Submission date": "date",
+    "Graduate student name": "student",
+    "Program/degree (PhD, MS, etc.)": "program",
+    "Thesis/dissertation title": "title",
+    "Leadership role type": "type",
+    "Course/workshop/guideline name": "name",
+    "Date (first day if multi-day)": "date",
+    "Society role type": "type",
+    "Society/organization name": "society",
+    "Board role type": "type",
+    "Board/organization name": "board",
+    "Speaking type": "type",
+    "Title of talk/workshop": "title",
+    "Conference/meeting name": "conference",
+    "Your role": "role",
+    "Publication title": "title",
+    "Journal name": "journal",
+    "Journal Impact Factor (max 15)": "impact_factor",
+    "Publication date": "date",
+    "DOI": "doi",
+    "Journal/newsletter/outlet": "outlet",
+    "Pathway activity": "type",
+    "Pathway name": "name",
+    "What Division oversees this Pathway?": "division",
+    "Textbook title": "textbook",
+    "Section name": "section",
+    "Chapter title (if applicable)": "chapter",
+    "Abstract/poster title": "title",
+    "Meeting (MARC, ASA, SCA, etc.)": "meeting",
+    "Editorial role": "type",
+}
+
+
 def get_field_key(field_name: str) -> str:
     """Convert CSV field name to a consistent key for the entry dict."""
-    # Map field names to report-friendly keys
-    key_mapping = {
-        "Committee name": "name",
-        "Your role (member, chair, etc.)": "role",
-        "Date of activity": "date",
-        "Name of Visiting Professor, Shadow Student, or Topic": "name",
-        "Lecture title": "title",
-        "Date delivered": "date",
-        "Board prep activity type": "type",
-        "Location": "location",
-        "Trainee name": "trainee",
-        "Title of poster/abstract/presentation/publication": "title",
-        "Meeting/journal name": "meeting",
-        "Date": "date",
-        "Award level": "level",
-        "Grant title": "title",
-        "PI name (if not you)": "pi",
-        "Funding agency": "agency",
-        "Submission type/outcome": "type",
-        "Agency": "agency",
-        "Submission date": "date",
-        "Graduate student name": "student",
-        "Program/degree (PhD, MS, etc.)": "program",
-        "Thesis/dissertation title": "title",
-        "Leadership role type": "type",
-        "Course/workshop/guideline name": "name",
-        "Date (first day if multi-day)": "date",
-        "Society role type": "type",
-        "Society/organization name": "society",
-        "Board role type": "type",
-        "Board/organization name": "board",
-        "Speaking type": "type",
-        "Title of talk/workshop": "title",
-        "Conference/meeting name": "conference",
-        "Your role": "role",
-        "Publication title": "title",
-        "Journal name": "journal",
-        "Journal Impact Factor (max 15)": "impact_factor",
-        "Publication date": "date",
-        "DOI": "doi",
-        "Journal/newsletter/outlet": "outlet",
-        "Pathway activity": "type",
-        "Pathway name": "name",
-        "What Division oversees this Pathway?": "division",
-        "Textbook title": "textbook",
-        "Section name": "section",
-        "Chapter title (if applicable)": "chapter",
-        "Abstract/poster title": "title",
-        "Meeting (MARC, ASA, SCA, etc.)": "meeting",
-        "Editorial role": "type",
-    }
-
-    if field_name in key_mapping:
-        return key_mapping[field_name]
+    key = _FIELD_KEYS.get(field_name)
+    if key is not None:
+        return key
 
     # Fallback: convert to snake_case
     return field_name.split("(")[0].strip().lower().replace(" ", "_").replace("/", "_")
 
 
+@functools.lru_cache(maxsize=None)
+def points_column_names(points_pattern: str, max_entries: int) -> tuple:
+    """Numbered points column names for a section, e.g. "Points for Role #1".."#5"."""
+    return tuple(f"{points_pattern}{n}" for n in range(1, max_entries + 1))
+
+
+def _is_entry_boundary(header: str) -> bool:
+    """Columns that close a repeating entry (its points calc) or a form section."""
+    return header.startswith("Points for ") or header == "Complete?"
+
+
+def _positional_plan(
+    headers: List[str],
+    col_index: Dict[str, List[int]],
+    type_col: str,
+    field_names: List[tuple],
+    points_cols: tuple,
+) -> Optional[tuple]:
+    """
+    Locate each entry by its numbered points column rather than by counting
+    occurrences of shared labels ("Your role", "Date", "Points for Role #1").
+
+    An entry's columns are the ones between the previous entry boundary and
+    its points column; of the candidate points columns, the one whose block
+    holds the type column and every field belongs to this section. Entries
+    that cannot be placed unambiguously are skipped without affecting the
+    rest; returns None if no entry can be placed.
+    """
+    plan = []
+    for points_col in points_cols:
+        matches = []
+        for points_idx in col_index.get(points_col, []):
+            start = points_idx - 1
+            while start >= 0 and not _is_entry_boundary(headers[start]):
+                start -= 1
+            block = {headers[i]: i for i in range(start + 1, points_idx)}
+            if type_col in block and all(name in block for _, name in field_names):
+                matches.append((block, points_idx))
+
+        if len(matches) != 1:
+            continue
+        block, points_idx = matches[0]
+        plan.append((
+            block[type_col],
+            tuple((key, block[name]) for key, name in field_names),
+            points_idx,
+        ))
+
+    return tuple(plan) if plan else None
+
+
+def section_plan(
+    col_index: Dict[str, List[int]],
+    type_col: str,
+    fields: List[str],
+    points_pattern: str,
+    max_entries: int,
+    start_occurrence: int = 0
+) -> tuple:
+    """
+    Resolve a repeating section to concrete column positions.
+
+    Returns one (type_idx, ((key, field_idx), ...), points_idx) tuple per
+    entry that exists in the header; points_idx is None when the numbered
+    points column is missing. Entries are placed from the header layout when
+    col_index carries the header row (see _positional_plan), otherwise by
+    counting label occurrences from start_occurrence. Plans are cached on a
+    ColumnIndex.
+    """
+    cache = getattr(col_index, "section_plans", None)
+    cache_key = (type_col, tuple(fields), points_pattern, max_entries, start_occurrence)
+    if cache is not None and cache_key in cache:
+        return cache[cache_key]
+
+    field_names = [
+        (get_field_key(field_name), field_name)
+        for field_name in fields
+        if field_name != type_col  # Type is read separately
+    ]
+    points_cols = points_column_names(points_pattern, max_entries)
+
+    headers = getattr(col_index, "headers", None)
+    plan = None
+    if headers is not None:
+        plan = _positional_plan(headers, col_index, type_col, field_names, points_cols)
+
+    if plan is None:
+        type_indices = col_index.get(type_col, [])
+        field_columns = [(key, col_index.get(name, [])) for key, name in field_names]
+
+        plan = []
+        for entry_num, points_col in enumerate(points_cols):
+            occurrence = start_occurrence + entry_num
+            if occurrence >= len(type_indices):
+                break
+
+            # Other fields follow the same occurrence pattern as the type column
+            field_slots = tuple(
+                (key, field_indices[occurrence])
+                for key, field_indices in field_columns
+                if occurrence < len(field_indices)
+            )
+
+            # Numbered points columns repeat per section; start_occurrence picks ours
+            points_indices = col_index.get(points_col, [])
+            points_idx = points_indices[start_occurrence] if start_occurrence < len(points_indices) else None
+
+            plan.append((type_indices[occurrence], field_slots, points_idx))
+        plan = tuple(plan)
+
+    if cache is not None:
+        cache[cache_key] = plan
+    return plan
+
+
 def parse_repeating_indexed(
     row: List[str],
     col_index: Dict[str, List[int]],
@@ -179,25 +479,19 @@ def parse_repeating_indexed(
         points_pattern: Pattern for points columns (e.g., "Points for Committee #")
         max_entries: Maximum number of entries to look for
         type_mapping: Optional mapping for type values
-        start_occurrence: Starting occurrence index for the type column
+        start_occurrence: Starting occurrence index for the type column; only
+                          used when entries cannot be placed from the header
+                          layout (see section_plan)
 
     Returns:
         List of parsed entries
     """
     entries = []
+    row_len = len(row)
+    plan = section_plan(col_index, type_col, fields, points_pattern, max_entries, start_occurrence)
 
-    # Get the type column indices
-    type_indices = col_index.get(type_col, [])
-
-    for entry_num in range(max_entries):
-        occurrence = start_occurrence + entry_num
-
-        # Get the type value for this entry
-        if occurrence >= len(type_indices):
-            break
-
-        type_idx = type_indices[occurrence]
-        if type_idx >= len(row):
+    for type_idx, field_slots, points_idx in plan:
+        if type_idx >= row_len:
             continue
 
         type_value = row[type_idx].strip()
@@ -207,9 +501,11 @@ def parse_repeating_indexed(
             continue
 
         if type_mapping:
-            if type_value in type_mapping and type_mapping[type_value] is None:
+            internal_type = lookup_choice(type_mapping, type_value, _UNMAPPED)
+            if internal_type is None:
                 continue  # Skip - user indicated no activity
-            internal_type = type_mapping.get(type_value)
+            if internal_type is _UNMAPPED:
+                internal_type = None
         else:
             internal_type = None
 
@@ -218,32 +514,17 @@ def parse_repeating_indexed(
         if internal_type:
             entry["internal_type"] = internal_type
 
-        # Get other field values - they follow the same occurrence pattern
-        for field_name in fields:
-            if field_name == type_col:
-                continue  # Already got type
-
-            field_indices = col_index.get(field_name, [])
-            if occurrence < len(field_indices):
-                field_idx = field_indices[occurrence]
-                if field_idx < len(row):
-                    value = row[field_idx].strip()
-                    if value:
-                        # Use a readable key name based on field purpose
-                        key = get_field_key(field_name)
-                        entry[key] = value
-
-        # Get points - look for the specific numbered points column
-        # Use start_occurrence to get the correct section's points columns
-        points_col = f"{points_pattern}{entry_num + 1}"
-        points_value = get_col_value(row, col_index, points_col, occurrence=start_occurrence)
-        if points_value:
-            try:
-                points = int(float(points_value))
-                if points > 0:
-                    entry["points"] = points
-            except (ValueError, TypeError):
-                pass
+        for key, field_idx in field_slots:
+            if field_idx < row_len:
+                value = row[field_idx].strip()
+                if value:
+                    entry[key] = value
+
+        # Get points from this entry's numbered points column
+        if points_idx is not None and points_idx < row_len:
+            points = parse_int(row[points_idx].strip())
+            if points > 0:
+                entry["points"] = points
 
         # Only add if we have meaningful data (type + at least points or another field)
         if entry.get("points", 0) > 0 or len(entry) > 2:
@@ -252,13 +533,12 @@ def parse_repeating_indexed(
     return entries
 
 
-def parse_row_indexed(row: List[str], headers: List[str], col_index: Dict[str, List[int]]) -> Optional[Dict[str, Any]]:
+def parse_row_indexed(row: List[str], col_index: Dict[str, List[int]]) -> Optional[Dict[str, Any]]:
     """
     Parse a single CSV row into structured faculty submission data using column indices.
 
     Args:
         row: List of values
-        headers: List of all column headers
         col_index: Map of column name -> list of indices
 
     Returns:
@@ -296,11 +576,11 @@ def parse_row_indexed(row: List[str], headers: List[str], col_index: Dict[str, L
 
     # Parse activities using indexed approach
     submission["activities"] = {
-        "citizenship": parse_citizenship_indexed(row, headers, col_index),
-        "education": parse_education_indexed(row, headers, col_index),
-        "research": parse_research_indexed(row, headers, col_index),
-        "leadership": parse_leadership_indexed(row, headers, col_index),
-        "content_expert": parse_content_expert_indexed(row, headers, col_index),
+        "citizenship": parse_citizenship_indexed(row, col_index),
+        "education": parse_education_indexed(row, col_index),
+        "research": parse_research_indexed(row, col_index),
+        "leadership": parse_leadership_indexed(row, col_index),
+        "content_expert": parse_content_expert_indexed(row, col_index),
     }
 
     # Extract totals from summary columns
@@ -314,7 +594,7 @@ def parse_row(row: Dict[str, str], headers: List[str]) -> Optional[Dict[str, Any
     return None
 
 
-def parse_citizenship_indexed(row: List[str], headers: List[str], col_index: Dict[str, List[int]]) -> Dict[str, Any]:
+def parse_citizenship_indexed(row: List[str], col_index: Dict[str, List[int]]) -> Dict[str, Any]:
     """Parse citizenship activities using indexed approach."""
     citizenship = {
         "evaluations": {},
@@ -358,7 +638,7 @@ def parse_citizenship(row: Dict[str, str], headers: List[str]) -> Dict[str, Any]
     return {"evaluations": {}, "committees": [], "department_activities": []}
 
 
-def parse_education_indexed(row: List[str], headers: List[str], col_index: Dict[str, List[int]]) -> Dict[str, Any]:
+def parse_education_indexed(row: List[str], col_index: Dict[str, List[int]]) -> Dict[str, Any]:
     """Parse education activities using indexed approach."""
     education = {
         "teaching_awards": {},
@@ -371,8 +651,10 @@ def parse_education_indexed(row: List[str], headers: List[str], col_index: Dict[
 
     # Teaching recognition
     teaching_response = get_col_value(row, col_index, "Which teaching recognition applies?")
-    if teaching_response and teaching_response in config.TEACHING_RECOGNITION:
-        award_type = config.TEACHING_RECOGNITION[teaching_response]
+    award_type = _UNMAPPED
+    if teaching_response:
+        award_type = lookup_choice(config.TEACHING_RECOGNITION, teaching_response, _UNMAPPED)
+    if award_type is not _UNMAPPED:
         education["teaching_awards"] = {
             "type": teaching_response,
             "internal_type": award_type,
@@ -405,7 +687,7 @@ def parse_education_indexed(row: List[str], headers: List[str], col_index: Dict[
         points_pattern="Points for Activity #",
         max_entries=5,
         type_mapping=config.BOARD_PREP_TYPES,
-        start_occurrence=1  # Skip first occurrence which is for dept activities
+        start_occurrence=1  # Occurrence fallback only: dept activities come first
     )
 
     # Mentorship
@@ -416,13 +698,13 @@ def parse_education_indexed(row: List[str], headers: List[str], col_index: Dict[
         points_pattern="Points for Activity #",
         max_entries=5,
         type_mapping=config.MENTORSHIP_TYPES,
-        start_occurrence=2  # Skip first two occurrences (dept activities, board prep)
+        start_occurrence=2  # Occurrence fallback only: after dept activities, board prep
     )
 
     # MyTIPreport / MTR feedback
     mtr_winner = get_col_value(row, col_index, "Were you an MTR Winner this quarter?") == "Yes"
     mytip_count_str = get_col_value(row, col_index, "How many MyTIPreport evaluations did you complete?")
-    mytip_count = int(mytip_count_str) if mytip_count_str.isdigit() else 0
+    mytip_count = max(parse_int(mytip_count_str), 0)
 
     if mtr_winner or mytip_count > 0:
         mytip_points = min(mytip_count * config.POINT_VALUES["mytip_each"],
@@ -439,7 +721,7 @@ def parse_education_indexed(row: List[str], headers: List[str], col_index: Dict[
     return education
 
 
-def parse_research_indexed(row: List[str], headers: List[str], col_index: Dict[str, List[int]]) -> Dict[str, Any]:
+def parse_research_indexed(row: List[str], col_index: Dict[str, List[int]]) -> Dict[str, Any]:
     """Parse research activities using indexed approach."""
     research = {
         "grant_review": {},
@@ -450,8 +732,10 @@ def parse_research_indexed(row: List[str], headers: List[str], col_index: Dict[s
 
     # Grant review (NIH study section)
     grant_review_type = get_col_value(row, col_index, "Grant review type")
-    if grant_review_type and grant_review_type in config.GRANT_REVIEW_TYPES:
-        review_type = config.GRANT_REVIEW_TYPES[grant_review_type]
+    review_type = _UNMAPPED
+    if grant_review_type:
+        review_type = lookup_choice(config.GRANT_REVIEW_TYPES, grant_review_type, _UNMAPPED)
+    if review_type is not _UNMAPPED:
         research["grant_review"] = {
             "type": grant_review_type,
             "internal_type": review_type,
@@ -490,7 +774,7 @@ def parse_research_indexed(row: List[str], headers: List[str], col_index: Dict[s
     return research
 
 
-def parse_leadership_indexed(row: List[str], headers: List[str], col_index: Dict[str, List[int]]) -> Dict[str, Any]:
+def parse_leadership_indexed(row: List[str], col_index: Dict[str, List[int]]) -> Dict[str, Any]:
     """Parse leadership activities using indexed approach."""
     leadership = {
         "education_leadership": [],
@@ -516,7 +800,7 @@ def parse_leadership_indexed(row: List[str], headers: List[str], col_index: Dict
         points_pattern="Points for Role #",
         max_entries=5,
         type_mapping=config.SOCIETY_LEADERSHIP_TYPES,
-        start_occurrence=1  # After education leadership
+        start_occurrence=1  # Occurrence fallback only: after education leadership
     )
 
     # Board leadership
@@ -527,13 +811,13 @@ def parse_leadership_indexed(row: List[str], headers: List[str], col_index: Dict
         points_pattern="Points for Role #",
         max_entries=5,
         type_mapping=config.BOARD_LEADERSHIP_TYPES,
-        start_occurrence=2  # After education and society leadership
+        start_occurrence=2  # Occurrence fallback only: after education, society leadership
     )
 
     return leadership
 
 
-def parse_content_expert_indexed(row: List[str], headers: List[str], col_index: Dict[str, List[int]]) -> Dict[str, Any]:
+def parse_content_expert_indexed(row: List[str], col_index: Dict[str, List[int]]) -> Dict[str, Any]:
     """Parse content expert activities using indexed approach."""
     content = {
         "speaking": [],
@@ -565,7 +849,7 @@ def parse_content_expert_indexed(row: List[str], headers: List[str], col_index:
         type_mapping=config.PUBLICATION_ROLES
     )
 
-    # Non-peer publications - uses same "Your role" column, so need to offset
+    # Non-peer publications - shares "Your role" with peer publications
     content["publications_nonpeer"] = parse_repeating_indexed(
         row, col_index,
         type_col="Your role",
@@ -573,7 +857,7 @@ def parse_content_expert_indexed(row: List[str], headers: List[str], col_index:
         points_pattern="Points for Publication #",
         max_entries=3,
         type_mapping=config.PUBLICATION_ROLES,
-        start_occurrence=5  # After peer-reviewed publications
+        start_occurrence=5  # Occurrence fallback only: after peer-reviewed publications
     )
 
     # Clinical pathways
@@ -594,7 +878,7 @@ def parse_content_expert_indexed(row: List[str], headers: List[str], col_index:
         points_pattern="Points for Contribution #",
         max_entries=3,
         type_mapping=config.TEXTBOOK_ROLES,
-        start_occurrence=8  # After peer + non-peer publications
+        start_occurrence=8  # Occurrence fallback only: after peer + non-peer publications
     )
 
     # Abstracts - uses "Your role" column
@@ -605,7 +889,7 @@ def parse_content_expert_indexed(row: List[str], headers: List[str], col_index:
         points_pattern="Points for Abstract #",
         max_entries=5,
         type_mapping=config.ABSTRACT_ROLES,
-        start_occurrence=11  # After peer + non-peer + textbooks
+        start_occurrence=11  # Occurrence fallback only: after peer + non-peer + textbooks
     )
 
     # Journal editorial
@@ -616,7 +900,7 @@ def parse_content_expert_indexed(row: List[str], headers: List[str], col_index:
         points_pattern="Points for Role #",
         max_entries=3,
         type_mapping=config.JOURNAL_EDITORIAL_TYPES,
-        start_occurrence=3  # After leadership roles
+        start_occurrence=3  # Occurrence fallback only: after leadership roles
     )
 
     return content
@@ -814,6 +1098,23 @@ def parse_content_expert(row: Dict[str, str], headers: List[str]) -> Dict[str, A
     return content
 
 
+@functools.lru_cache(maxsize=None)
+def _repeating_field_columns(field_type: str) -> tuple:
+    """
+    Column names for each entry of a REPEATING_FIELD_PATTERNS section, with
+    "#{n}" filled in: ((field_key, column), ...) plus the points column.
+    """
+    pattern = config.REPEATING_FIELD_PATTERNS[field_type]
+    fields = pattern["fields"]
+    return tuple(
+        (
+            tuple((field_key, col_pattern.replace("#{n}", f"#{n}")) for field_key, col_pattern in fields.items()),
+            fields.get("points", "").replace("#{n}", f"#{n}"),
+        )
+        for n in range(1, pattern["max_entries"] + 1)
+    )
+
+
 def parse_repeating_fields(
     row: Dict[str, str],
     headers: List[str],
@@ -840,29 +1141,15 @@ def parse_repeating_fields(
         return []
 
     entries = []
-    max_entries = pattern["max_entries"]
-    fields = pattern["fields"]
-    type_col = pattern.get("type_column")
-
-    # Find all occurrences of the type column in headers
-    # This helps us identify each repeating group
-    type_col_indices = []
-    if type_col:
-        for i, h in enumerate(headers):
-            if h == type_col:
-                type_col_indices.append(i)
 
     # For each potential entry, try to extract data
     # We need to be careful because column names repeat
-    for entry_num in range(1, max_entries + 1):
+    for entry_columns, points_col in _repeating_field_columns(field_type):
         entry = {}
         has_data = False
 
         # Try to get values for this entry
-        for field_key, col_pattern in fields.items():
-            # Replace {n} with entry number if present
-            col_name = col_pattern.replace("#{n}", f"#{entry_num}")
-
+        for field_key, col_name in entry_columns:
             # Get value from row
             value = row.get(col_name, "").strip()
 
@@ -879,16 +1166,10 @@ def parse_repeating_fields(
                 has_data = True
 
         # Extract points if available
-        points_col = fields.get("points", "").replace("#{n}", f"#{entry_num}")
-        points_str = row.get(points_col, "")
-        if points_str:
-            try:
-                points = int(float(points_str))
-                if points > 0:
-                    entry["points"] = points
-                    has_data = True
-            except (ValueError, TypeError):
-                pass
+        points = parse_int(row.get(points_col, ""))
+        if points > 0:
+            entry["points"] = points
+            has_data = True
 
         if has_data and entry.get("type") or entry.get("points", 0) > 0:
             entries.append(entry)
@@ -900,21 +1181,17 @@ def extract_totals_indexed(row: List[str], col_index: Dict[str, List[int]]) -> D
     """Extract point totals from summary columns using indexed approach."""
     totals = {}
 
+    row_len = len(row)
     for col_name, key in config.TOTAL_COLUMNS.items():
-        value = get_col_value(row, col_index, col_name)
-        try:
-            totals[key] = int(float(value)) if value else 0
-        except (ValueError, TypeError):
+        indices = col_index.get(col_name)
+        if indices and indices[0] < row_len:
+            totals[key] = parse_int(row[indices[0]].strip())
+        else:
             totals[key] = 0
 
     return totals
 
 
-def extract_totals(row: Dict[str, str]) -> Dict[str, int]:
-    """Legacy - not used."""
-    return {}
-
-
 def aggregate_by_faculty(submissions: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
     """
     Aggregate multiple submissions per faculty member.
@@ -943,8 +1220,9 @@ def aggregate_by_faculty(submissions: List[Dict[str, Any]]) -> Dict[str, Dict[st
             continue  # Skip if we can't identify
 
         # Initialize or update faculty record
-        if key not in faculty:
-            faculty[key] = {
+        fac = faculty.get(key)
+        if fac is None:
+            fac = faculty[key] = {
                 "email": email,
                 "first_name": first_name,
                 "last_name": last_name,
@@ -997,8 +1275,6 @@ def aggregate_by_faculty(submissions: List[Dict[str, Any]]) -> Dict[str, Dict[st
                 },
             }
 
-        fac = faculty[key]
-
         # Track submission metadata
         quarter = sub.get("quarter", "")
         if quarter and quarter not in fac["quarters_reported"]:
@@ -1036,21 +1312,23 @@ def merge_activities(
     Adds quarter and record_id metadata to each activity for tracking.
     """
     for category, cat_data in source.items():
-        if category not in target:
+        target_cat = target.get(category)
+        if target_cat is None:
             continue
 
         for subcat, items in cat_data.items():
-            if subcat not in target[category]:
+            existing = target_cat.get(subcat, _UNMAPPED)
+            if existing is _UNMAPPED:
                 continue
 
             # Handle dict entries (single values like evaluations, teaching_awards)
             if isinstance(items, dict) and items:
-                if isinstance(target[category][subcat], dict):
+                if isinstance(existing, dict):
                     # Add metadata and store/update
                     items["quarter"] = quarter
                     items["record_id"] = record_id
-                    if not target[category][subcat]:
-                        target[category][subcat] = items
+                    if not existing:
+                        target_cat[subcat] = items
                     # For multiple quarters, could store list - for now take latest
 
             # Handle list entries (multiple activities)
@@ -1059,7 +1337,7 @@ def merge_activities(
                     if isinstance(item, dict):
                         item["quarter"] = quarter
                         item["record_id"] = record_id
-                        target[category][subcat].append(item)
+                        existing.append(item)
 
 
 def build_activity_index(faculty_data: Dict[str, Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
@@ -1090,10 +1368,13 @@ def build_activity_index(faculty_data: Dict[str, Dict[str, Any]]) -> Dict[str, L
                     entry = {**items, **faculty_info}
                     index[activity_key].append(entry)
                 elif isinstance(items, list):
-                    for item in items:
-                        if isinstance(item, dict) and item:
-                            entry = {**item, **faculty_info}
-                            index[activity_key].append(entry)
+                    entries = [
+                        {**item, **faculty_info}
+                        for item in items
+                        if isinstance(item, dict) and item
+                    ]
+                    if entries:  # Only activity types with data get an index key
+                        index[activity_key].extend(entries)
 
     return dict(index)
 
@@ -1115,8 +1396,9 @@ def calculate_summary(faculty_data: Dict[str, Dict[str, Any]]) -> Dict[str, Any]
     }
 
     for fac in faculty_data.values():
+        fac_totals = fac.get("totals", {})
         for key in grand_totals:
-            grand_totals[key] += fac.get("totals", {}).get(key, 0)
+            grand_totals[key] += fac_totals.get(key, 0)
 
     return {
         "total_faculty": total_faculty,
@@ -1133,19 +1415,26 @@ def get_faculty_list(faculty_data: Dict[str, Dict[str, Any]]) -> List[Dict[str,
     Returns:
         List of {email, display_name, total_points, has_incomplete, quarters}
     """
-    faculty_list = []
-    for email, fac in faculty_data.items():
-        faculty_list.append({
+    return list(iter_faculty_summaries(faculty_data))
+
+
+def iter_faculty_summaries(faculty_data: Dict[str, Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield get_faculty_list entries one at a time, sorted by display name.
+
+    Only the sort keys are materialised; each summary dict is built as it
+    is consumed.
+    """
+    # Sort by display name
+    ordered = sorted(faculty_data.items(), key=lambda item: item[1]["display_name"].lower())
+    for email, fac in ordered:
+        yield {
             "email": email,
             "display_name": fac["display_name"],
             "total_points": fac["totals"].get("total", 0),
             "has_incomplete": fac["has_incomplete"],
             "quarters": fac["quarters_reported"],
-        })
-
-    # Sort by display name
-    faculty_list.sort(key=lambda x: x["display_name"].lower())
-    return faculty_list
+        }
 
 
 def get_activity_types_with_data(activity_index: Dict[str, List]) -> List[Dict[str, Any]]:
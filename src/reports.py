@@ -9,16 +9,53 @@ Reports can be converted to PDF using the pdf_generator module.
 """
 
 import csv
+import functools
 import io
-from typing import Dict, List, Any, Optional
+from collections import defaultdict
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 from . import config
 
 
+# TOC anchor slugs, applied to the lowercased heading text in a single pass
+_ACTIVITY_ANCHOR_TABLE = str.maketrans({" ": "-", "/": "-"})
+_FACULTY_ANCHOR_TABLE = str.maketrans({" ": "-", ",": None})
+
+
+def _timestamp() -> str:
+    """Current time as shown in the "Report Generated" lines."""
+    return datetime.now().strftime('%Y-%m-%d %H:%M')
+
+
+@functools.lru_cache(maxsize=None)
+def _category_plan(
+    include_categories: Optional[Tuple[str, ...]]
+) -> Tuple[Tuple[str, str, Tuple[Tuple[str, str], ...]], ...]:
+    """
+    Resolve the categories for a faculty summary against config once.
+
+    Returns (category, category_name, ((subcat, subcat_name), ...)) tuples in
+    report order; None means all categories.
+    """
+    if include_categories is None:
+        include_categories = tuple(config.ACTIVITY_CATEGORIES)
+
+    plan = []
+    for category in include_categories:
+        cat_info = config.ACTIVITY_CATEGORIES.get(category, {})
+        subcats = tuple(
+            (subcat, config.ACTIVITY_DISPLAY_NAMES.get(subcat, subcat))
+            for subcat in cat_info.get("subcategories", [])
+        )
+        plan.append((category, cat_info.get("name", category.title()), subcats))
+    return tuple(plan)
+
+
 def generate_faculty_summary(
     faculty_record: Dict[str, Any],
-    include_categories: Optional[List[str]] = None
+    include_categories: Optional[List[str]] = None,
+    generated_at: Optional[str] = None
 ) -> str:
     """
     Generate a Markdown summary for a single faculty member.
@@ -27,6 +64,8 @@ def generate_faculty_summary(
         faculty_record: Faculty data from parser
         include_categories: Optional list of category keys to include.
                           If None, includes all categories.
+        generated_at: Preformatted timestamp; batch callers pass one so the
+                      clock is read once per document. Defaults to now.
 
     Returns:
         Markdown formatted string
@@ -55,7 +94,7 @@ def generate_faculty_summary(
         lines.append(f"- **Email:** {email}")
     if quarters:
         lines.append(f"- **Quarters Reported:** {', '.join(quarters)}")
-    lines.append(f"- **Report Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+    lines.append(f"- **Report Generated:** {generated_at or _timestamp()}")
     lines.append("")
 
     # Point totals
@@ -75,14 +114,12 @@ def generate_faculty_summary(
     activities = faculty_record.get("activities", {})
 
     # Determine which categories to include
-    categories_to_include = include_categories or list(config.ACTIVITY_CATEGORIES.keys())
+    plan = _category_plan(tuple(include_categories) if include_categories else None)
 
-    for category in categories_to_include:
+    for category, cat_name, subcats in plan:
         if category not in activities:
             continue
 
-        cat_info = config.ACTIVITY_CATEGORIES.get(category, {})
-        cat_name = cat_info.get("name", category.title())
         cat_data = activities[category]
 
         # Check if category has any data
@@ -93,12 +130,11 @@ def generate_faculty_summary(
         lines.append("")
 
         # Generate section for each subcategory
-        for subcat in cat_info.get("subcategories", []):
+        for subcat, subcat_name in subcats:
             subcat_data = cat_data.get(subcat)
             if not subcat_data:
                 continue
 
-            subcat_name = config.ACTIVITY_DISPLAY_NAMES.get(subcat, subcat)
             section_md = format_subcategory(subcat, subcat_name, subcat_data)
             if section_md:
                 lines.append(section_md)
@@ -109,12 +145,7 @@ def generate_faculty_summary(
 
 def has_category_data(cat_data: Dict[str, Any]) -> bool:
     """Check if a category has any activity data."""
-    for key, value in cat_data.items():
-        if isinstance(value, dict) and value:
-            return True
-        elif isinstance(value, list) and value:
-            return True
-    return False
+    return any(value for value in cat_data.values() if isinstance(value, (dict, list)))
 
 
 def format_subcategory(subcat: str, display_name: str, data: Any) -> str:
@@ -187,164 +218,204 @@ def format_activity_table(subcat: str, entries: List[Dict[str, Any]]) -> str:
     if not entries:
         return ""
 
-    # Define table columns based on subcategory
-    columns = get_table_columns(subcat)
-    if not columns:
+    spec = _TABLE_SPECS.get(subcat)
+    if spec is None:
         return format_generic_list(entries)
 
-    # Build table
-    lines = []
+    return _render_table(spec, entries)
 
-    # Header row
-    header = "| " + " | ".join(col["header"] for col in columns) + " |"
-    lines.append(header)
 
-    # Separator row
+def get_table_columns(subcat: str) -> List[Dict[str, Any]]:
+    """Get table column definitions for a subcategory."""
+    return _TABLE_COLUMNS.get(subcat, [])
+
+
+def _table_spec(columns: List[Dict[str, Any]]) -> Tuple[str, str, Tuple[Tuple[str, bool], ...]]:
+    """Prebuild the header line, separator line and (key, is_points) pairs for a table."""
+    header = "| " + " | ".join(col["header"] for col in columns) + " |"
     separator = "|" + "|".join(
         "---:" if col.get("align") == "right" else "---"
         for col in columns
     ) + "|"
-    lines.append(separator)
+    cols = tuple((col["key"], col.get("format") == "points") for col in columns)
+    return header, separator, cols
 
-    # Data rows
-    for entry in entries:
-        row_values = []
-        for col in columns:
-            value = entry.get(col["key"], "")
-            if col.get("format") == "points" and value:
-                try:
-                    value = f"{int(float(value)):,}"
-                except (ValueError, TypeError):
-                    pass
-            row_values.append(str(value) if value else "-")
+
+def _format_points(value: Any) -> str:
+    """Format a points cell with thousands separators ("-" when empty)."""
+    if not value:
+        return "-"
+    # The parser stores points as ints; skip the float round-trip for those
+    if type(value) is int:
+        return f"{value:,}"
+    try:
+        return f"{int(float(value)):,}"
+    except (ValueError, TypeError):
+        return str(value)
+
+
+def _render_table(
+    spec: Tuple[str, str, Tuple[Tuple[str, bool], ...]],
+    entries: List[Dict[str, Any]],
+    lead_cells: Optional[List[str]] = None
+) -> str:
+    """
+    Render entries against a prebuilt table spec.
+
+    lead_cells, if given, supplies an extra first cell per entry (the header
+    and separator in spec must already include that column).
+    """
+    header, separator, cols = spec
+    lines = [header, separator]
+
+    for i, entry in enumerate(entries):
+        entry_get = entry.get
+        row_values = [lead_cells[i] or "-"] if lead_cells is not None else []
+        for key, is_points in cols:
+            value = entry_get(key, "")
+            if is_points:
+                row_values.append(_format_points(value))
+            else:
+                row_values.append(str(value) if value else "-")
         lines.append("| " + " | ".join(row_values) + " |")
 
     return "\n".join(lines)
 
 
-def get_table_columns(subcat: str) -> List[Dict[str, Any]]:
-    """Get table column definitions for a subcategory."""
-    columns_map = {
-        "committees": [
-            {"key": "type", "header": "Committee Type"},
-            {"key": "name", "header": "Committee Name"},
-            {"key": "role", "header": "Role"},
-            {"key": "quarter", "header": "Quarter"},
-            {"key": "points", "header": "Points", "align": "right", "format": "points"},
-        ],
-        "department_activities": [
-            {"key": "type", "header": "Activity"},
-            {"key": "name", "header": "Topic/Name"},
-            {"key": "date", "header": "Date"},
-            {"key": "points", "header": "Points", "align": "right", "format": "points"},
-        ],
-        "lectures": [
-            {"key": "type", "header": "Type"},
-            {"key": "title", "header": "Title"},
-            {"key": "date", "header": "Date"},
-            {"key": "points", "header": "Points", "align": "right", "format": "points"},
-        ],
-        "board_prep": [
-            {"key": "type", "header": "Activity"},
-            {"key": "date", "header": "Date"},
-            {"key": "location", "header": "Location"},
-            {"key": "points", "header": "Points", "align": "right", "format": "points"},
-        ],
-        "mentorship": [
-            {"key": "type", "header": "Type"},
-            {"key": "trainee", "header": "Trainee"},
-            {"key": "title", "header": "Title"},
-            {"key": "meeting", "header": "Meeting/Journal"},
-            {"key": "points", "header": "Points", "align": "right", "format": "points"},
-        ],
-        "grant_awards": [
-            {"key": "level", "header": "Award Level"},
-            {"key": "title", "header": "Grant Title"},
-            {"key": "agency", "header": "Agency"},
-            {"key": "points", "header": "Points", "align": "right", "format": "points"},
-        ],
-        "grant_submissions": [
-            {"key": "type", "header": "Outcome"},
-            {"key": "title", "header": "Grant Title"},
-            {"key": "agency", "header": "Agency"},
-            {"key": "date", "header": "Date"},
-            {"key": "points", "header": "Points", "align": "right", "format": "points"},
-        ],
-        "thesis_committees": [
-            {"key": "student", "header": "Student"},
-            {"key": "program", "header": "Program"},
-            {"key": "title", "header": "Title"},
-            {"key": "points", "header": "Points", "align": "right", "format": "points"},
-        ],
-        "education_leadership": [
-            {"key": "type", "header": "Role"},
-            {"key": "name", "header": "Course/Workshop"},
-            {"key": "date", "header": "Date"},
-            {"key": "points", "header": "Points", "align": "right", "format": "points"},
-        ],
-        "society_leadership": [
-            {"key": "type", "header": "Role"},
-            {"key": "society", "header": "Society/Organization"},
-            {"key": "points", "header": "Points", "align": "right", "format": "points"},
-        ],
-        "board_leadership": [
-            {"key": "type", "header": "Role"},
-            {"key": "board", "header": "Board/Organization"},
-            {"key": "points", "header": "Points", "align": "right", "format": "points"},
-        ],
-        "speaking": [
-            {"key": "type", "header": "Type"},
-            {"key": "title", "header": "Title"},
-            {"key": "conference", "header": "Conference"},
-            {"key": "date", "header": "Date"},
-            {"key": "location", "header": "Location"},
-            {"key": "points", "header": "Points", "align": "right", "format": "points"},
-        ],
-        "publications_peer": [
-            {"key": "type", "header": "Role"},  # Parser stores role as 'type'
-            {"key": "title", "header": "Title"},
-            {"key": "journal", "header": "Journal"},
-            {"key": "impact_factor", "header": "IF"},
-            {"key": "doi", "header": "DOI"},
-            {"key": "date", "header": "Date"},
-            {"key": "points", "header": "Points", "align": "right", "format": "points"},
-        ],
-        "publications_nonpeer": [
-            {"key": "type", "header": "Role"},  # Parser stores role as 'type'
-            {"key": "title", "header": "Title"},
-            {"key": "outlet", "header": "Outlet"},
-            {"key": "date", "header": "Date"},
-            {"key": "points", "header": "Points", "align": "right", "format": "points"},
-        ],
-        "pathways": [
-            {"key": "type", "header": "Type"},
-            {"key": "name", "header": "Pathway Name"},
-            {"key": "division", "header": "Division"},
-            {"key": "points", "header": "Points", "align": "right", "format": "points"},
-        ],
-        "textbooks": [
-            {"key": "type", "header": "Role"},  # Parser stores role as 'type'
-            {"key": "textbook", "header": "Textbook"},
-            {"key": "section", "header": "Section"},
-            {"key": "chapter", "header": "Chapter"},
-            {"key": "points", "header": "Points", "align": "right", "format": "points"},
-        ],
-        "abstracts": [
-            {"key": "type", "header": "Role"},  # Parser stores role as 'type'
-            {"key": "title", "header": "Title"},
-            {"key": "meeting", "header": "Meeting"},
-            {"key": "date", "header": "Date"},
-            {"key": "location", "header": "Location"},
-            {"key": "points", "header": "Points", "align": "right", "format": "points"},
-        ],
-        "journal_editorial": [
-            {"key": "type", "header": "Role"},
-            {"key": "journal", "header": "Journal"},
-            {"key": "points", "header": "Points", "align": "right", "format": "points"},
-        ],
-    }
-
-    return columns_map.get(subcat, [])
+# Table column definitions per subcategory
+_TABLE_COLUMNS: Dict[str, List[Dict[str, Any]]] = {
+    "committees": [
+        {"key": "type", "header": "Committee Type"},
+        {"key": "name", "header": "Committee Name"},
+        {"key": "role", "header": "Role"},
+        {"key": "quarter", "header": "Quarter"},
+        {"key": "points", "header": "Points", "align": "right", "format": "points"},
+    ],
+    "department_activities": [
+        {"key": "type", "header": "Activity"},
+        {"key": "name", "header": "Topic/Name"},
+        {"key": "date", "header": "Date"},
+        {"key": "points", "header": "Points", "align": "right", "format": "points"},
+    ],
+    "lectures": [
+        {"key": "type", "header": "Type"},
+        {"key": "title", "header": "Title"},
+        {"key": "date", "header": "Date"},
+        {"key": "points", "header": "Points", "align": "right", "format": "points"},
+    ],
+    "board_prep": [
+        {"key": "type", "header": "Activity"},
+        {"key": "date", "header": "Date"},
+        {"key": "location", "header": "Location"},
+        {"key": "points", "header": "Points", "align": "right", "format": "points"},
+    ],
+    "mentorship": [
+        {"key": "type", "header": "Type"},
+        {"key": "trainee", "header": "Trainee"},
+        {"key": "title", "header": "Title"},
+        {"key": "meeting", "header": "Meeting/Journal"},
+        {"key": "points", "header": "Points", "align": "right", "format": "points"},
+    ],
+    "grant_awards": [
+        {"key": "level", "header": "Award Level"},
+        {"key": "title", "header": "Grant Title"},
+        {"key": "agency", "header": "Agency"},
+        {"key": "points", "header": "Points", "align": "right", "format": "points"},
+    ],
+    "grant_submissions": [
+        {"key": "type", "header": "Outcome"},
+        {"key": "title", "header": "Grant Title"},
+        {"key": "agency", "header": "Agency"},
+        {"key": "date", "header": "Date"},
+        {"key": "points", "header": "Points", "align": "right", "format": "points"},
+    ],
+    "thesis_committees": [
+        {"key": "student", "header": "Student"},
+        {"key": "program", "header": "Program"},
+        {"key": "title", "header": "Title"},
+        {"key": "points", "header": "Points", "align": "right", "format": "points"},
+    ],
+    "education_leadership": [
+        {"key": "type", "header": "Role"},
+        {"key": "name", "header": "Course/Workshop"},
+        {"key": "date", "header": "Date"},
+        {"key": "points", "header": "Points", "align": "right", "format": "points"},
+    ],
+    "society_leadership": [
+        {"key": "type", "header": "Role"},
+        {"key": "society", "header": "Society/Organization"},
+        {"key": "points", "header": "Points", "align": "right", "format": "points"},
+    ],
+    "board_leadership": [
+        {"key": "type", "header": "Role"},
+        {"key": "board", "header": "Board/Organization"},
+        {"key": "points", "header": "Points", "align": "right", "format": "points"},
+    ],
+    "speaking": [
+        {"key": "type", "header": "Type"},
+        {"key": "title", "header": "Title"},
+        {"key": "conference", "header": "Conference"},
+        {"key": "date", "header": "Date"},
+        {"key": "location", "header": "Location"},
+        {"key": "points", "header": "Points", "align": "right", "format": "points"},
+    ],
+    "publications_peer": [
+        {"key": "type", "header": "Role"},  # Parser stores role as 'type'
+        {"key": "title", "header": "Title"},
+        {"key": "journal", "header": "Journal"},
+        {"key": "impact_factor", "header": "IF"},
+        {"key": "doi", "header": "DOI"},
+        {"key": "date", "header": "Date"},
+        {"key": "points", "header": "Points", "align": "right", "format": "points"},
+    ],
+    "publications_nonpeer": [
+        {"key": "type", "header": "Role"},  # Parser stores role as 'type'
+        {"key": "title", "header": "Title"},
+        {"key": "outlet", "header": "Outlet"},
+        {"key": "date", "header": "Date"},
+        {"key": "points", "header": "Points", "align": "right", "format": "points"},
+    ],
+    "pathways": [
+        {"key": "type", "header": "Type"},
+        {"key": "name", "header": "Pathway Name"},
+        {"key": "division", "header": "Division"},
+        {"key": "points", "header": "Points", "align": "right", "format": "points"},
+    ],
+    "textbooks": [
+        {"key": "type", "header": "Role"},  # Parser stores role as 'type'
+        {"key": "textbook", "header": "Textbook"},
+        {"key": "section", "header": "Section"},
+        {"key": "chapter", "header": "Chapter"},
+        {"key": "points", "header": "Points", "align": "right", "format": "points"},
+    ],
+    "abstracts": [
+        {"key": "type", "header": "Role"},  # Parser stores role as 'type'
+        {"key": "title", "header": "Title"},
+        {"key": "meeting", "header": "Meeting"},
+        {"key": "date", "header": "Date"},
+        {"key": "location", "header": "Location"},
+        {"key": "points", "header": "Points", "align": "right", "format": "points"},
+    ],
+    "journal_editorial": [
+        {"key": "type", "header": "Role"},
+        {"key": "journal", "header": "Journal"},
+        {"key": "points", "header": "Points", "align": "right", "format": "points"},
+    ],
+}
+
+
+_FACULTY_COLUMN = {"key": "faculty", "header": "Faculty"}
+
+# Header/separator lines are fixed per subcategory, so build them once
+_TABLE_SPECS = {
+    subcat: _table_spec(columns) for subcat, columns in _TABLE_COLUMNS.items()
+}
+# The faculty cell is passed to _render_table as a lead cell, so these specs
+# only add the column to the header/separator and reuse the plain columns
+_FACULTY_TABLE_SPECS = {
+    subcat: _table_spec([_FACULTY_COLUMN] + columns)[:2] + (_TABLE_SPECS[subcat][2],)
+    for subcat, columns in _TABLE_COLUMNS.items()
+}
 
 
 def format_generic_list(entries: List[Dict[str, Any]]) -> str:
@@ -363,7 +434,8 @@ def format_generic_list(entries: List[Dict[str, Any]]) -> str:
 def generate_activity_report(
     activity_key: str,
     entries: List[Dict[str, Any]],
-    sort_by: str = "faculty"
+    sort_by: str = "faculty",
+    generated_at: Optional[str] = None
 ) -> str:
     """
     Generate a Markdown report for a specific activity type.
@@ -372,6 +444,7 @@ def generate_activity_report(
         activity_key: Activity key in format "category.subcategory"
         entries: List of activity entries with faculty info attached
         sort_by: Sort order - "faculty", "date", or "points"
+        generated_at: Preformatted timestamp. Defaults to now.
 
     Returns:
         Markdown formatted string
@@ -392,12 +465,9 @@ def generate_activity_report(
     lines.append("")
     lines.append(f"**Category:** {category_name}")
     lines.append(f"**Total Entries:** {len(entries)}")
-    lines.append(f"**Report Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+    lines.append(f"**Report Generated:** {generated_at or _timestamp()}")
     lines.append("")
 
-    # Sort entries
-    sorted_entries = sort_entries(entries, sort_by)
-
     # Calculate total points
     total_points = sum(int(e.get("points", 0)) for e in entries if e.get("points"))
     lines.append(f"**Total Points (all faculty):** {total_points:,}")
@@ -408,13 +478,11 @@ def generate_activity_report(
         lines.append("## Entries by Faculty Member")
         lines.append("")
 
-        # Group entries by faculty
-        by_faculty = {}
-        for entry in sorted_entries:
-            faculty_name = entry.get("display_name", "Unknown")
-            if faculty_name not in by_faculty:
-                by_faculty[faculty_name] = []
-            by_faculty[faculty_name].append(entry)
+        # Group entries by faculty; only the group names need sorting since
+        # each group keeps its entries in their original order
+        by_faculty = defaultdict(list)
+        for entry in entries:
+            by_faculty[entry.get("display_name", "Unknown")].append(entry)
 
         for faculty_name in sorted(by_faculty.keys()):
             faculty_entries = by_faculty[faculty_name]
@@ -435,21 +503,21 @@ def generate_activity_report(
         lines.append("## All Entries")
         lines.append("")
 
-        # Add faculty column to table
-        enhanced_entries = []
-        for entry in sorted_entries:
-            enhanced = {**entry}
-            incomplete_marker = " [INC]" if entry.get("has_incomplete") else ""
-            enhanced["faculty"] = entry.get("display_name", "Unknown") + incomplete_marker
-            enhanced_entries.append(enhanced)
-
-        # Get columns and prepend faculty column
-        columns = get_table_columns(subcat)
-        if columns:
-            columns = [{"key": "faculty", "header": "Faculty"}] + columns
-            lines.append(format_activity_table_with_columns(enhanced_entries, columns))
+        sorted_entries = sort_entries(entries, sort_by)
+        faculty_cells = [
+            entry.get("display_name", "Unknown") + (" [INC]" if entry.get("has_incomplete") else "")
+            for entry in sorted_entries
+        ]
+
+        # Table columns with the faculty column prepended
+        spec = _FACULTY_TABLE_SPECS.get(subcat)
+        if spec is not None:
+            lines.append(_render_table(spec, sorted_entries, faculty_cells) if sorted_entries else "")
         else:
-            lines.append(format_generic_list(enhanced_entries))
+            lines.append(format_generic_list([
+                {**entry, "faculty": faculty}
+                for entry, faculty in zip(sorted_entries, faculty_cells)
+            ]))
 
     return "\n".join(lines)
 
@@ -462,33 +530,7 @@ def format_activity_table_with_columns(
     if not entries or not columns:
         return ""
 
-    lines = []
-
-    # Header row
-    header = "| " + " | ".join(col["header"] for col in columns) + " |"
-    lines.append(header)
-
-    # Separator row
-    separator = "|" + "|".join(
-        "---:" if col.get("align") == "right" else "---"
-        for col in columns
-    ) + "|"
-    lines.append(separator)
-
-    # Data rows
-    for entry in entries:
-        row_values = []
-        for col in columns:
-            value = entry.get(col["key"], "")
-            if col.get("format") == "points" and value:
-                try:
-                    value = f"{int(float(value)):,}"
-                except (ValueError, TypeError):
-                    pass
-            row_values.append(str(value) if value else "-")
-        lines.append("| " + " | ".join(row_values) + " |")
-
-    return "\n".join(lines)
+    return _render_table(_table_spec(columns), entries)
 
 
 def sort_entries(entries: List[Dict[str, Any]], sort_by: str) -> List[Dict[str, Any]]:
@@ -518,11 +560,12 @@ def generate_combined_activity_report(
     Returns:
         Markdown formatted string
     """
+    generated_at = _timestamp()
     lines = []
 
     lines.append("# Selected Academic Activities Report")
     lines.append("")
-    lines.append(f"**Report Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+    lines.append(f"**Report Generated:** {generated_at}")
     lines.append(f"**Activity Types Included:** {len(activity_keys)}")
     lines.append("")
 
@@ -535,7 +578,7 @@ def generate_combined_activity_report(
             _, subcat = parts
             display_name = config.ACTIVITY_DISPLAY_NAMES.get(subcat, subcat)
             # Create anchor link
-            anchor = display_name.lower().replace(" ", "-").replace("/", "-")
+            anchor = display_name.lower().translate(_ACTIVITY_ANCHOR_TABLE)
             lines.append(f"- [{display_name}](#{anchor})")
     lines.append("")
 
@@ -546,7 +589,7 @@ def generate_combined_activity_report(
     for key in activity_keys:
         entries = activity_index.get(key, [])
         if entries:
-            report = generate_activity_report(key, entries, sort_by)
+            report = generate_activity_report(key, entries, sort_by, generated_at=generated_at)
             lines.append(report)
             lines.append("")
             lines.append("---")
@@ -573,11 +616,13 @@ def generate_batch_faculty_summaries(
         If combined=True: {"combined": markdown_string}
         If combined=False: {email: markdown_string, ...}
     """
+    generated_at = _timestamp()
+
     if combined:
         lines = []
         lines.append("# Faculty Academic Achievement Summaries")
         lines.append("")
-        lines.append(f"**Report Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+        lines.append(f"**Report Generated:** {generated_at}")
         lines.append(f"**Faculty Included:** {len(selected_emails)}")
         lines.append("")
 
@@ -587,7 +632,7 @@ def generate_batch_faculty_summaries(
         for email in selected_emails:
             fac = faculty_data.get(email, {})
             name = fac.get("display_name", email)
-            anchor = name.lower().replace(" ", "-").replace(",", "")
+            anchor = name.lower().translate(_FACULTY_ANCHOR_TABLE)
             lines.append(f"- [{name}](#{anchor})")
         lines.append("")
 
@@ -598,7 +643,7 @@ def generate_batch_faculty_summaries(
         for email in selected_emails:
             fac = faculty_data.get(email)
             if fac:
-                summary = generate_faculty_summary(fac)
+                summary = generate_faculty_summary(fac, generated_at=generated_at)
                 lines.append(summary)
                 lines.append("")
                 lines.append("---")
@@ -612,7 +657,7 @@ def generate_batch_faculty_summaries(
         for email in selected_emails:
             fac = faculty_data.get(email)
             if fac:
-                results[email] = generate_faculty_summary(fac)
+                results[email] = generate_faculty_summary(fac, generated_at=generated_at)
         return results
 
 
@@ -636,29 +681,30 @@ def generate_points_summary_csv(
     else:
         emails_to_include = list(faculty_data.keys())
 
-    # Build list of faculty with their data
-    faculty_list = []
+    # One row tuple per faculty member, in output column order
+    rows = []
     for email in emails_to_include:
         fac = faculty_data.get(email)
         if not fac:
             continue
 
-        faculty_list.append({
-            "last_name": fac.get("last_name", ""),
-            "first_name": fac.get("first_name", ""),
-            "email": fac.get("email", ""),
-            "quarters": ", ".join(fac.get("quarters_reported", [])),
-            "status": "Incomplete" if fac.get("has_incomplete") else "Complete",
-            "citizenship": fac.get("totals", {}).get("citizenship", 0),
-            "education": fac.get("totals", {}).get("education", 0),
-            "research": fac.get("totals", {}).get("research", 0),
-            "leadership": fac.get("totals", {}).get("leadership", 0),
-            "content_expert": fac.get("totals", {}).get("content_expert", 0),
-            "total": fac.get("totals", {}).get("total", 0),
-        })
+        totals = fac.get("totals", {})
+        rows.append((
+            fac.get("last_name", ""),
+            fac.get("first_name", ""),
+            fac.get("email", ""),
+            ", ".join(fac.get("quarters_reported", [])),
+            "Incomplete" if fac.get("has_incomplete") else "Complete",
+            totals.get("citizenship", 0),
+            totals.get("education", 0),
+            totals.get("research", 0),
+            totals.get("leadership", 0),
+            totals.get("content_expert", 0),
+            totals.get("total", 0),
+        ))
 
     # Sort by last name, then first name
-    faculty_list.sort(key=lambda x: (x["last_name"].lower(), x["first_name"].lower()))
+    rows.sort(key=lambda row: (row[0].lower(), row[1].lower()))
 
     # Generate CSV
     output = io.StringIO()
@@ -680,20 +726,7 @@ def generate_points_summary_csv(
     ])
 
     # Data rows
-    for fac in faculty_list:
-        writer.writerow([
-            fac["last_name"],
-            fac["first_name"],
-            fac["email"],
-            fac["quarters"],
-            fac["status"],
-            fac["citizenship"],
-            fac["education"],
-            fac["research"],
-            fac["leadership"],
-            fac["content_expert"],
-            fac["total"],
-        ])
+    writer.writerows(rows)
 
     return output.getvalue()
 
@@ -51,6 +51,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'reports_app.middleware.PointConfigCacheMiddleware',
 ]
 
 ROOT_URLCONF = 'webapp.urls'
@@ -183,5 +184,17 @@ MEDIA_ROOT = BASE_DIR / 'media'
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
 DATA_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
 
+# DOI / journal metric lookups (Impact Factor verification)
+# Responses are cached on disk when requests-cache is installed; the default
+# lives in the user cache dir, outside the (possibly read-only) app tree
+_USER_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+DOI_CACHE_PATH = Path(
+    os.environ.get('DOI_CACHE_PATH') or _USER_CACHE_DIR / 'aaa-summarizer' / 'doi_cache.sqlite'
+)
+DOI_CACHE_EXPIRE_DAYS = int(os.environ.get('DOI_CACHE_EXPIRE_DAYS', '30'))
+# Contact address sent as mailto= so CrossRef/OpenAlex use their polite pool;
+# left empty, no contact address is sent
+CROSSREF_MAILTO = os.environ.get('CROSSREF_MAILTO', '')
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'